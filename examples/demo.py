@@ -5,12 +5,16 @@ Demonstrates curve analysis, risk detection, and optimal window calculation.
 Perfect for screen recordings and promotional videos.
 """
 
+import logging
+import os
 import sys
 import time
 from datetime import datetime
 
+# Make the repository's src package importable when run as examples/demo.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 # Suppress logging for cleaner output
-import logging
 logging.getLogger().setLevel(logging.CRITICAL)
 
 def print_header(title: str, char: str = "="):
@@ -169,6 +173,8 @@ def main():
     print_section("RISK ASSESSMENT")
     
     try:
+        from src.curve_intelligence.risk_model import RISK_WEIGHTS, classify_risk, score_risk
+        
         # Calculate risk score using formula from risk-model.md
         sniper_score = 0.75
         volatility = 0.58
@@ -178,29 +184,20 @@ def main():
         liquidity_risk_inv = 1.0 - liquidity_depth
         velocity_norm = min(1.0, velocity * 1.2)
         
-        risk_score = (
-            0.35 * sniper_score +
-            0.25 * volatility +
-            0.20 * velocity_norm +
-            0.20 * liquidity_risk_inv
+        risk_score = score_risk(sniper_score, volatility, velocity_norm, liquidity_risk_inv)
+        components = zip(
+            ("Sniper", "Volatility", "Velocity", "Liquidity"),
+            RISK_WEIGHTS,
+            (sniper_score, volatility, velocity_norm, liquidity_risk_inv)
         )
         
-        if risk_score >= 0.9:
-            risk_level = "critical"
-        elif risk_score >= 0.7:
-            risk_level = "high"
-        elif risk_score >= 0.35:
-            risk_level = "medium"
-        else:
-            risk_level = "low"
+        risk_level = classify_risk(risk_score).value
         
         print_success("Risk assessment completed")
         print_data("Risk Score", f"{risk_score:.3f}")
         print_data("Risk Level", risk_level.upper())
-        print_data("Sniper Component", f"{0.35 * sniper_score:.3f} (35% weight)")
-        print_data("Volatility Component", f"{0.25 * volatility:.3f} (25% weight)")
-        print_data("Velocity Component", f"{0.20 * velocity_norm:.3f} (20% weight)")
-        print_data("Liquidity Component", f"{0.20 * liquidity_risk_inv:.3f} (20% weight)")
+        for name, weight, value in components:
+            print_data(f"{name} Component", f"{weight * value:.3f} ({weight:.0%} weight)")
         print()
         
         # Privacy mode recommendation
@@ -25,13 +25,15 @@ setup(
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
     ],
-    python_requires=">=3.10",
+    python_requires=">=3.11",
     install_requires=requirements,
     extras_require={
+        "jit": [
+            "numba>=0.58.0",
+        ],
         "dev": [
             "pytest>=7.4.3",
             "pytest-asyncio>=0.21.1",
@@ -0,0 +1,24 @@
+"""
+API Responses
+
+orjson-rendered JSON responses for the API routes.
+"""
+
+from typing import Any
+import orjson
+from fastapi.responses import Response
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class OrjsonResponse(Response):
+    """
+    JSON response serialized with orjson (FastAPI's ORJSONResponse is deprecated)
+
+    Routes return it directly so FastAPI skips its jsonable_encoder pass:
+    orjson serializes dataclasses, enums and NumPy values itself.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
@@ -4,62 +4,129 @@ API Routes for Curve Intelligence
 REST API endpoints for curve analysis and intelligence.
 """
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+import re
+from functools import lru_cache
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 from typing import Optional
 from solders.pubkey import Pubkey
+from .responses import OrjsonResponse
 from ..curve_intelligence.intelligence_layer import CurveIntelligenceLayer
 from ..config.settings import Settings
+from ..utils.timestamps import format_iso_timestamp
 
 router = APIRouter(prefix="/api/v1/curve", tags=["curve"])
 
-# Global intelligence layer (in production, use dependency injection)
-intelligence = CurveIntelligenceLayer(rpc_url=Settings.SOLANA_RPC_URL)
+# Per-process intelligence layer, built on first use (after any worker fork)
+_intelligence: Optional[CurveIntelligenceLayer] = None
 
 
-class AnalyzeTokenRequest(BaseModel):
-    """Request model for token analysis"""
+def get_intelligence() -> CurveIntelligenceLayer:
+    """Get the intelligence layer for this worker process"""
+    global _intelligence
+    if _intelligence is None:
+        _intelligence = CurveIntelligenceLayer(rpc_url=Settings.SOLANA_RPC_URL)
+    return _intelligence
+
+
+async def close_intelligence():
+    """Close the intelligence layer for this worker process"""
+    global _intelligence
+    if _intelligence is not None:
+        await _intelligence.close()
+        _intelligence = None
+
+
+# Base58 alphabet (no 0, O, I, l); 32-byte keys encode to 32-44 characters
+_B58_RE = re.compile(r"[1-9A-HJ-NP-Za-km-z]{32,44}")
+
+
+@lru_cache(maxsize=4096)
+def _parse_mint(token_mint: str) -> Pubkey:
+    """Decode a base58 mint address; repeat requests for a mint hit the cache"""
+    if not _B58_RE.fullmatch(token_mint):
+        raise ValueError(f"Invalid token mint address: {token_mint!r}")
+    return Pubkey.from_string(token_mint)
+
+
+def parse_path_mint(token_mint: str) -> Pubkey:
+    """Decode the {token_mint} path parameter (invalid mints fail with 422)"""
+    try:
+        return _parse_mint(token_mint)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+class TokenMintRequest(BaseModel):
+    """Base request model for endpoints that take a token mint"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     token_mint: str = Field(..., description="Token mint address")
+    
+    _mint: Pubkey = PrivateAttr()
+    
+    @model_validator(mode="after")
+    def _parse_token_mint(self):
+        """Decode the mint once during validation (invalid mints fail with 422)"""
+        self._mint = _parse_mint(self.token_mint)
+        return self
+    
+    @property
+    def mint(self) -> Pubkey:
+        """Parsed token mint"""
+        return self._mint
 
 
-class GetOptimalWindowRequest(BaseModel):
+class AnalyzeTokenRequest(TokenMintRequest):
+    """Request model for token analysis"""
+
+
+class GetOptimalWindowRequest(TokenMintRequest):
     """Request model for optimal window"""
-    token_mint: str = Field(..., description="Token mint address")
     intent: str = Field(..., description="Transaction intent: 'buy' or 'sell'")
     amount: float = Field(..., ge=0.0, description="Transaction amount")
 
 
-class AssessTradeImpactRequest(BaseModel):
+class AssessTradeImpactRequest(TokenMintRequest):
     """Request model for trade impact assessment"""
-    token_mint: str = Field(..., description="Token mint address")
     amount: float = Field(..., ge=0.0, description="Trade amount")
     trade_type: str = Field(..., description="Trade type: 'buy' or 'sell'")
 
 
 @router.post("/analyze")
-async def analyze_token(request: AnalyzeTokenRequest):
+async def analyze_token(
+    request: AnalyzeTokenRequest,
+    intelligence: CurveIntelligenceLayer = Depends(get_intelligence)
+):
     """
     Comprehensive token analysis
     
     Returns curve analysis, risk assessment, and patterns.
     """
     try:
-        token_mint = Pubkey.from_string(request.token_mint)
+        token_mint = request.mint
         analysis = await intelligence.analyze_token(token_mint)
-        return analysis
+        # Coalesced requests share the analysis dict, so it is not modified here
+        return OrjsonResponse({
+            **analysis,
+            "timestamp_iso": format_iso_timestamp(analysis["timestamp"])
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/optimal-window")
-async def get_optimal_window(request: GetOptimalWindowRequest):
+async def get_optimal_window(
+    request: GetOptimalWindowRequest,
+    intelligence: CurveIntelligenceLayer = Depends(get_intelligence)
+):
     """
     Get optimal execution window
     
     Returns the best time window for executing a transaction.
     """
     try:
-        token_mint = Pubkey.from_string(request.token_mint)
+        token_mint = request.mint
         
         if request.intent not in ["buy", "sell"]:
             raise HTTPException(status_code=400, detail="intent must be 'buy' or 'sell'")
@@ -70,18 +137,18 @@ async def get_optimal_window(request: GetOptimalWindowRequest):
             request.amount
         )
         
-        return {
+        return OrjsonResponse({
             "token_mint": request.token_mint,
             "intent": request.intent,
             "amount": request.amount,
-            "start_time": window.start_time.isoformat(),
-            "end_time": window.end_time.isoformat(),
-            "optimal_time": window.optimal_time.isoformat() if window.optimal_time else None,
+            "start_time": window.start_time,
+            "end_time": window.end_time,
+            "optimal_time": window.optimal_time,
             "risk_level": window.risk_level.value,
             "expected_slippage": window.expected_slippage,
             "sniper_activity": window.sniper_activity,
             "confidence": window.confidence
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -89,47 +156,59 @@ async def get_optimal_window(request: GetOptimalWindowRequest):
 
 
 @router.get("/risk/{token_mint}")
-async def get_risk_assessment(token_mint: str):
+async def get_risk_assessment(
+    mint: Pubkey = Depends(parse_path_mint),
+    intelligence: CurveIntelligenceLayer = Depends(get_intelligence)
+):
     """Get risk assessment for a token"""
     try:
-        mint = Pubkey.from_string(token_mint)
         assessment = await intelligence.assess_risk(mint)
-        return assessment
+        return OrjsonResponse(assessment)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/sniper/{token_mint}")
-async def detect_sniper(token_mint: str, time_window: int = 5):
+async def detect_sniper(
+    time_window: int = 5,
+    mint: Pubkey = Depends(parse_path_mint),
+    intelligence: CurveIntelligenceLayer = Depends(get_intelligence)
+):
     """Detect sniper activity"""
     try:
-        mint = Pubkey.from_string(token_mint)
         result = await intelligence.detect_sniper_window(mint, time_window)
-        return result
+        return OrjsonResponse(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/patterns/{token_mint}")
-async def get_patterns(token_mint: str, time_window: int = 30):
+async def get_patterns(
+    token_mint: str,
+    time_window: int = 30,
+    mint: Pubkey = Depends(parse_path_mint),
+    intelligence: CurveIntelligenceLayer = Depends(get_intelligence)
+):
     """Get detected patterns"""
     try:
-        mint = Pubkey.from_string(token_mint)
         patterns = await intelligence.detect_patterns(mint, time_window)
-        return {
+        return OrjsonResponse({
             "token_mint": token_mint,
             "patterns": patterns,
             "count": len(patterns)
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/trade-impact")
-async def assess_trade_impact(request: AssessTradeImpactRequest):
+async def assess_trade_impact(
+    request: AssessTradeImpactRequest,
+    intelligence: CurveIntelligenceLayer = Depends(get_intelligence)
+):
     """Assess trade impact on curve"""
     try:
-        token_mint = Pubkey.from_string(request.token_mint)
+        token_mint = request.mint  # Parsed (and cached) during validation
         
         if request.trade_type not in ["buy", "sell"]:
             raise HTTPException(status_code=400, detail="trade_type must be 'buy' or 'sell'")
@@ -140,7 +219,7 @@ async def assess_trade_impact(request: AssessTradeImpactRequest):
             request.trade_type
         )
         
-        return impact
+        return OrjsonResponse(impact)
     except HTTPException:
         raise
     except Exception as e:
@@ -2,18 +2,31 @@
 FastAPI server for Curve Intelligence
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from .routes import router
+from .responses import OrjsonResponse
+from .routes import router, get_intelligence, close_intelligence
 from ..config.settings import Settings
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the intelligence layer per worker on startup, close it on shutdown"""
+    get_intelligence()
+    yield
+    await close_intelligence()
+
+
 app = FastAPI(
     title="Evalys Curve Intelligence",
     description="Real-time curve analysis and risk detection for memecoin launchpads",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=OrjsonResponse
 )
 
 # CORS middleware
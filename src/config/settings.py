@@ -15,6 +15,9 @@ class Settings:
     DEFAULT_TIME_WINDOW_MINUTES: int = int(os.getenv("DEFAULT_TIME_WINDOW_MINUTES", "30"))
     SNIPER_DETECTION_WINDOW: int = int(os.getenv("SNIPER_DETECTION_WINDOW", "5"))
     
+    # Cache settings
+    CURVE_CACHE_SIZE: int = int(os.getenv("CURVE_CACHE_SIZE", "4096"))
+    
     # Risk thresholds
     HIGH_RISK_THRESHOLD: float = float(os.getenv("HIGH_RISK_THRESHOLD", "0.7"))
     CRITICAL_RISK_THRESHOLD: float = float(os.getenv("CRITICAL_RISK_THRESHOLD", "0.9"))
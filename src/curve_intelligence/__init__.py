@@ -4,7 +4,7 @@ Evalys Curve Intelligence
 Real-time curve analysis, risk detection, and execution window optimization.
 """
 
-from .curve_analyzer import CurveAnalyzer
+from .curve_analyzer import CurveAnalyzer, CurveAnalysis
 from .risk_detector import RiskDetector, RiskLevel
 from .window_optimizer import WindowOptimizer, ExecutionWindow
 from .pattern_recognition import PatternRecognizer, PatternType
@@ -12,6 +12,7 @@ from .intelligence_layer import CurveIntelligenceLayer
 
 __all__ = [
     "CurveAnalyzer",
+    "CurveAnalysis",
     "RiskDetector",
     "RiskLevel",
     "WindowOptimizer",
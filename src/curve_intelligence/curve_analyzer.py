@@ -4,14 +4,180 @@ Curve Analyzer
 Analyzes bonding curve data in real-time.
 """
 
-from typing import Optional, Dict, Any
+import asyncio
+import math
+import time
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterator, Mapping, Union
+import numpy as np
 from solders.pubkey import Pubkey
-from datetime import datetime
+from ..config.settings import Settings
 from ..data.collectors import DataCollector
+from ..utils.cache import TTLCache
+from ..utils.jit import njit, NUMBA_AVAILABLE
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Price histories at least this long are analyzed in a worker thread
+OFFLOAD_MIN_PRICE_POINTS = 4096
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, boundscheck=False, nogil=True)
+    def _volatility_kernel(price_changes: np.ndarray) -> float:
+        """Population standard deviation of a float64 array (two-pass)"""
+        n = price_changes.size
+        total = 0.0
+        for i in range(n):
+            total += price_changes[i]
+        mean = total / n
+        
+        sq_total = 0.0
+        for i in range(n):
+            delta = price_changes[i] - mean
+            sq_total += delta * delta
+        return math.sqrt(sq_total / n)
+    
+else:
+    def _volatility_kernel(price_changes: np.ndarray) -> float:
+        """Population standard deviation of a float64 array"""
+        return float(price_changes.std())
+
+
+@njit(cache=True)
+def _slope_position(slope: float, price: float) -> float:
+    """Position on the curve (0.0 = early, 1.0 = late)"""
+    # Simplified calculation
+    # Real implementation would use actual curve parameters
+    if slope == 0:
+        return 0.5
+    
+    # Normalize based on slope and price
+    # Higher price + steeper slope = later position
+    return min(1.0, max(0.0, (price * slope) / 1000.0))
+
+
+@njit(cache=True)
+def _liquidity_depth(liquidity: float, market_cap: float) -> float:
+    """Liquidity depth (0.0 = shallow, 1.0 = deep)"""
+    if market_cap == 0:
+        return 0.0
+    
+    # Ratio of liquidity to market cap
+    ratio = liquidity / market_cap
+    return min(1.0, max(0.0, ratio * 10))  # Normalize
+
+
+@njit(cache=True)
+def _normalized_volatility(price_changes: np.ndarray) -> float:
+    """Standard deviation of price changes normalized to 0-1"""
+    if price_changes.size < 2:
+        return 0.0
+    return min(1.0, _volatility_kernel(price_changes) / 0.1)  # Assuming 0.1 is high volatility
+
+
+@njit(cache=True, nogil=True)
+def _fused_metrics(
+    price_changes: np.ndarray,
+    slope: float,
+    price: float,
+    liquidity: float,
+    market_cap: float
+):
+    """Slope position, liquidity depth and volatility in one compiled call"""
+    return (
+        _slope_position(slope, price),
+        _liquidity_depth(liquidity, market_cap),
+        _normalized_volatility(price_changes),
+    )
+
+
+if NUMBA_AVAILABLE:
+    # Pay the JIT compile (or cache load) cost at import, not on the first request
+    _fused_metrics(np.zeros(2, dtype=np.float64), 0.0, 0.0, 0.0, 0.0)
+
+
+@dataclass(slots=True)
+class CurveAnalysis(Mapping[str, Any]):
+    """
+    Curve analysis result
+    
+    Also a read-only Mapping of field names to values (analysis["volatility"],
+    analysis.get("volatility"), keys(), iteration, dict(analysis) and
+    **analysis) for callers written against the dict result.
+    
+    Attributes:
+        token_mint: Token mint address
+        current_price: Current price
+        slope: Curve slope
+        slope_position: Position on the curve (0.0 to 1.0)
+        liquidity: Available liquidity
+        liquidity_depth: Liquidity depth (0.0 to 1.0)
+        total_supply: Total token supply
+        market_cap: Market capitalization
+        volatility: Price volatility (0.0 to 1.0)
+        timestamp: Analysis time in epoch milliseconds
+    """
+    token_mint: str
+    current_price: float
+    slope: float
+    slope_position: float
+    liquidity: float
+    liquidity_depth: float
+    total_supply: float
+    market_cap: float
+    volatility: float
+    timestamp: int
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self.__dataclass_fields__
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(_ANALYSIS_FIELDS)
+    
+    def __len__(self) -> int:
+        return len(_ANALYSIS_FIELDS)
+
+
+_ANALYSIS_FIELDS = tuple(field.name for field in fields(CurveAnalysis))
+
+
+@lru_cache(maxsize=4096)
+def _mint_str(token_mint: Pubkey) -> str:
+    """Base58-encode a mint once; repeat lookups on the same Pubkey hit the cache"""
+    return str(token_mint)
+
+
+@lru_cache(maxsize=4096)
+def _decode_mint(token_mint: str) -> Pubkey:
+    """Decode a base58 mint string once; repeat lookups of the same string hit the cache"""
+    return Pubkey.from_string(token_mint)
+
+
+def _cache_key(token_mint: Union[Pubkey, str]) -> bytes:
+    """
+    Analysis cache key for a mint
+    
+    Keys are the raw 32 pubkey bytes: cheaper to hash than the base58
+    string, and a Pubkey converts to them without running the encoder.
+    
+    Args:
+        token_mint: Token mint address (Pubkey or base58 string)
+        
+    Returns:
+        32-byte key
+    """
+    if isinstance(token_mint, str):
+        token_mint = _decode_mint(token_mint)
+    return bytes(token_mint)
+
 
 class CurveAnalyzer:
     """
@@ -26,30 +192,72 @@ class CurveAnalyzer:
             data_collector: Data collector instance
         """
         self.data_collector = data_collector
-        self.cache: Dict[str, Dict[str, Any]] = {}
+        self.cache: TTLCache = TTLCache(
+            maxsize=Settings.CURVE_CACHE_SIZE,
+            ttl=Settings.DEFAULT_TIME_WINDOW_MINUTES * 60
+        )
         logger.info("CurveAnalyzer initialized")
     
     async def analyze_curve(
         self,
-        token_mint: Pubkey,
+        token_mint: Union[Pubkey, str],
         curve_data: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+    ) -> CurveAnalysis:
         """
         Analyze bonding curve
         
         Args:
-            token_mint: Token mint address
+            token_mint: Token mint address (Pubkey, or base58 string as received)
             curve_data: Optional curve data (fetches if not provided)
             
         Returns:
-            Dictionary with analysis results
+            CurveAnalysis instance
         """
+        # A string mint is used as-is for the result and decoded through the
+        # cache (for the fetch and the cache key)
+        if isinstance(token_mint, str):
+            mint_str = token_mint
+            token_mint = _decode_mint(token_mint)
+        else:
+            mint_str = _mint_str(token_mint)
+        
         if curve_data is None and self.data_collector:
             curve_data = await self.data_collector.get_curve_data(token_mint)
         
         if not curve_data:
             raise ValueError("No curve data available")
         
+        # Long price histories are crunched off the event loop so pending
+        # requests are not stalled behind the numeric work
+        if len(curve_data.get("price_changes", ())) >= OFFLOAD_MIN_PRICE_POINTS:
+            analysis = await asyncio.to_thread(self._compute_analysis, mint_str, curve_data)
+        else:
+            analysis = self._compute_analysis(mint_str, curve_data)
+        
+        # Cache analysis
+        self.cache[_cache_key(token_mint)] = analysis
+        
+        # Lazy %-formatting: skipped entirely unless debug logging is enabled
+        logger.debug(
+            "Analyzed curve for %s: position=%.2f, depth=%.2f",
+            mint_str,
+            analysis.slope_position,
+            analysis.liquidity_depth
+        )
+        
+        return analysis
+    
+    def _compute_analysis(self, mint_str: str, curve_data: Dict[str, Any]) -> CurveAnalysis:
+        """
+        Compute curve metrics (CPU-bound, safe to run in a worker thread)
+        
+        Args:
+            mint_str: Token mint address as string
+            curve_data: Curve data
+            
+        Returns:
+            CurveAnalysis instance
+        """
         # Calculate metrics
         current_price = curve_data.get("current_price", 0.0)
         slope = curve_data.get("slope", 0.0)
@@ -57,34 +265,30 @@ class CurveAnalyzer:
         total_supply = curve_data.get("total_supply", 0.0)
         market_cap = curve_data.get("market_cap", 0.0)
         
-        # Calculate slope position (where on the curve)
-        slope_position = self._calculate_slope_position(slope, current_price)
-        
-        # Calculate liquidity depth
-        liquidity_depth = self._calculate_liquidity_depth(liquidity, market_cap)
-        
-        # Calculate volatility
-        volatility = self._calculate_volatility(curve_data)
-        
-        analysis = {
-            "token_mint": str(token_mint),
-            "current_price": current_price,
-            "slope": slope,
-            "slope_position": slope_position,  # 0.0 to 1.0
-            "liquidity": liquidity,
-            "liquidity_depth": liquidity_depth,  # 0.0 to 1.0
-            "total_supply": total_supply,
-            "market_cap": market_cap,
-            "volatility": volatility,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        
-        # Cache analysis
-        self.cache[str(token_mint)] = analysis
+        # np.asarray is a zero-copy view when price_changes is already a float64 array
+        price_changes = np.asarray(curve_data.get("price_changes", ()), dtype=np.float64)
         
-        logger.debug(f"Analyzed curve for {token_mint}: position={slope_position:.2f}, depth={liquidity_depth:.2f}")
+        # Slope position (where on the curve), liquidity depth and volatility
+        slope_position, liquidity_depth, volatility = _fused_metrics(
+            price_changes,
+            float(slope),
+            float(current_price),
+            float(liquidity),
+            float(market_cap)
+        )
         
-        return analysis
+        return CurveAnalysis(
+            token_mint=mint_str,
+            current_price=current_price,
+            slope=slope,
+            slope_position=slope_position,
+            liquidity=liquidity,
+            liquidity_depth=liquidity_depth,
+            total_supply=total_supply,
+            market_cap=market_cap,
+            volatility=volatility,
+            timestamp=int(time.time() * 1000)  # Epoch ms, formatted lazily by the API
+        )
     
     def _calculate_slope_position(self, slope: float, price: float) -> float:
         """
@@ -97,15 +301,7 @@ class CurveAnalyzer:
         Returns:
             Position value (0.0 to 1.0)
         """
-        # Simplified calculation
-        # Real implementation would use actual curve parameters
-        if slope == 0:
-            return 0.5
-        
-        # Normalize based on slope and price
-        # Higher price + steeper slope = later position
-        normalized = min(1.0, max(0.0, (price * slope) / 1000.0))
-        return normalized
+        return _slope_position(float(slope), float(price))
     
     def _calculate_liquidity_depth(self, liquidity: float, market_cap: float) -> float:
         """
@@ -118,12 +314,7 @@ class CurveAnalyzer:
         Returns:
             Depth value (0.0 to 1.0)
         """
-        if market_cap == 0:
-            return 0.0
-        
-        # Ratio of liquidity to market cap
-        ratio = liquidity / market_cap
-        return min(1.0, max(0.0, ratio * 10))  # Normalize
+        return _liquidity_depth(float(liquidity), float(market_cap))
     
     def _calculate_volatility(self, curve_data: Dict[str, Any]) -> float:
         """
@@ -136,33 +327,20 @@ class CurveAnalyzer:
             Volatility value (0.0 to 1.0)
         """
         # Simplified - would use price history in real implementation
-        price_changes = curve_data.get("price_changes", [])
-        
-        if not price_changes:
-            return 0.0
-        
-        # Calculate standard deviation of price changes
-        if len(price_changes) < 2:
-            return 0.0
-        
-        mean = sum(price_changes) / len(price_changes)
-        variance = sum((x - mean) ** 2 for x in price_changes) / len(price_changes)
-        std_dev = variance ** 0.5
-        
-        # Normalize to 0-1
-        return min(1.0, std_dev / 0.1)  # Assuming 0.1 is high volatility
+        price_changes = np.asarray(curve_data.get("price_changes", ()), dtype=np.float64)
+        return _normalized_volatility(price_changes)
     
-    def get_cached_analysis(self, token_mint: Pubkey) -> Optional[Dict[str, Any]]:
+    def get_cached_analysis(self, token_mint: Union[Pubkey, str]) -> Optional[CurveAnalysis]:
         """
         Get cached analysis if available
         
         Args:
-            token_mint: Token mint address
+            token_mint: Token mint address (Pubkey or base58 string)
             
         Returns:
             Cached analysis or None
         """
-        return self.cache.get(str(token_mint))
+        return self.cache.get(_cache_key(token_mint))
     
     def clear_cache(self):
         """Clear analysis cache"""
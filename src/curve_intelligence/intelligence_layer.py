@@ -4,17 +4,113 @@ Curve Intelligence Layer
 Main interface that coordinates all curve intelligence components.
 """
 
-from typing import Optional, Dict, Any
+import asyncio
+import os
+import sys
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Union, Callable, Awaitable, Hashable, TypeVar
 from solders.pubkey import Pubkey
-from .curve_analyzer import CurveAnalyzer
+from .curve_analyzer import CurveAnalyzer, CurveAnalysis
 from .risk_detector import RiskDetector
 from .window_optimizer import WindowOptimizer, ExecutionWindow
 from .pattern_recognition import PatternRecognizer
+from ..config.settings import Settings
 from ..data.collectors import DataCollector
+from ..utils.cache import TTLCache
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+# How long a curve analysis is reused by back-to-back consumers of the same mint
+CURVE_MEMO_TTL_SECONDS = 2.0
+
+
+# CurveMetrics fields sent to Arcium, read from the curve analysis (missing = 0)
+_METRIC_KEYS = (
+    "current_price",
+    "price_change_24h",
+    "liquidity_depth",
+    "buy_pressure",
+    "sell_pressure",
+)
+
+# Sibling checkout of evalys-arcium-bridge-service, next to this repository
+_ARCIUM_BRIDGE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+    "evalys-arcium-bridge-service", "src"
+)
+
+
+@lru_cache(maxsize=None)
+def _load_arcium() -> Optional[Dict[str, Any]]:
+    """
+    Import the Arcium bridge client once per process
+    
+    Returns:
+        Client class and model classes, or None if the bridge is not available
+    """
+    if not os.path.exists(_ARCIUM_BRIDGE_PATH):
+        return None
+    
+    bridge_root = os.path.dirname(_ARCIUM_BRIDGE_PATH)
+    if bridge_root not in sys.path:
+        sys.path.insert(0, bridge_root)
+    
+    try:
+        from bridge.arcium_client import ArciumBridgeClient
+        from bridge.models import SizingPreferences, UserConstraints, CurveMetrics
+    except ImportError:
+        logger.warning("Arcium bridge service not available for confidential intel")
+        return None
+    
+    return {
+        "client": ArciumBridgeClient,
+        "models": {
+            "SizingPreferences": SizingPreferences,
+            "UserConstraints": UserConstraints,
+            "CurveMetrics": CurveMetrics,
+        }
+    }
+
+
+async def _single_flight(
+    inflight: Dict[K, "asyncio.Task[T]"],
+    key: K,
+    factory: Callable[[], Awaitable[T]]
+) -> T:
+    """
+    Run factory() once per key at a time; concurrent callers share its result
+    
+    The computation runs in its own task and every caller (the first one
+    included) awaits it through asyncio.shield, so a cancelled caller only
+    stops waiting: the others still get the result.
+    
+    Args:
+        inflight: Map of keys to the tasks currently computing them
+        key: Coalescing key
+        factory: Creates the awaitable that computes the result
+        
+    Returns:
+        Result of the (shared) computation
+    """
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        inflight[key] = task
+        
+        def forget(done: "asyncio.Task[T]") -> None:
+            if inflight.get(key) is done:
+                del inflight[key]
+            if not done.cancelled():
+                done.exception()  # Mark retrieved in case every caller was cancelled
+        
+        task.add_done_callback(forget)
+    
+    return await asyncio.shield(task)
+
 
 class CurveIntelligenceLayer:
     """
@@ -24,6 +120,19 @@ class CurveIntelligenceLayer:
     and pattern recognition.
     """
     
+    __slots__ = (
+        "data_collector",
+        "_curve_analyzer",
+        "_risk_detector",
+        "_window_optimizer",
+        "_pattern_recognizer",
+        "use_confidential_intel",
+        "_arcium_live_client",
+        "_inflight",
+        "_curve_cache",
+        "_curve_inflight",
+    )
+    
     def __init__(
         self,
         rpc_url: str = "https://api.mainnet-beta.solana.com",
@@ -39,17 +148,57 @@ class CurveIntelligenceLayer:
             use_confidential_intel: Whether to use Arcium confidential intelligence
         """
         self.data_collector = data_collector or DataCollector(rpc_url=rpc_url)
-        self.curve_analyzer = CurveAnalyzer(data_collector=self.data_collector)
-        self.risk_detector = RiskDetector(data_collector=self.data_collector)
-        self.window_optimizer = WindowOptimizer(
-            risk_detector=self.risk_detector,
-            curve_analyzer=self.curve_analyzer
-        )
-        self.pattern_recognizer = PatternRecognizer(data_collector=self.data_collector)
+        # Components are built on first use (see the properties below)
+        self._curve_analyzer: Optional[CurveAnalyzer] = None
+        self._risk_detector: Optional[RiskDetector] = None
+        self._window_optimizer: Optional[WindowOptimizer] = None
+        self._pattern_recognizer: Optional[PatternRecognizer] = None
         self.use_confidential_intel = use_confidential_intel
-        self._arcium_client = None
+        # ArciumBridgeClient instance (its class is only importable at runtime)
+        self._arcium_live_client: Optional[Any] = None
+        # Mint -> task of the analysis currently being computed for it
+        self._inflight: Dict[Pubkey, "asyncio.Task[Dict[str, Any]]"] = {}
+        # Short-lived curve analyses shared by analyze_token and the Arcium path
+        self._curve_cache: TTLCache = TTLCache(
+            maxsize=Settings.CURVE_CACHE_SIZE,
+            ttl=CURVE_MEMO_TTL_SECONDS
+        )
+        self._curve_inflight: Dict[Pubkey, "asyncio.Task[CurveAnalysis]"] = {}
         
-        logger.info(f"CurveIntelligenceLayer initialized (confidential_intel: {use_confidential_intel})")
+        logger.info(
+            f"CurveIntelligenceLayer initialized (confidential_intel: {use_confidential_intel})"
+        )
+    
+    @property
+    def curve_analyzer(self) -> CurveAnalyzer:
+        """Curve analyzer (created on first access)"""
+        if self._curve_analyzer is None:
+            self._curve_analyzer = CurveAnalyzer(data_collector=self.data_collector)
+        return self._curve_analyzer
+    
+    @property
+    def risk_detector(self) -> RiskDetector:
+        """Risk detector (created on first access)"""
+        if self._risk_detector is None:
+            self._risk_detector = RiskDetector(data_collector=self.data_collector)
+        return self._risk_detector
+    
+    @property
+    def window_optimizer(self) -> WindowOptimizer:
+        """Window optimizer (created on first access, with its dependencies)"""
+        if self._window_optimizer is None:
+            self._window_optimizer = WindowOptimizer(
+                risk_detector=self.risk_detector,
+                curve_analyzer=self.curve_analyzer
+            )
+        return self._window_optimizer
+    
+    @property
+    def pattern_recognizer(self) -> PatternRecognizer:
+        """Pattern recognizer (created on first access)"""
+        if self._pattern_recognizer is None:
+            self._pattern_recognizer = PatternRecognizer(data_collector=self.data_collector)
+        return self._pattern_recognizer
     
     async def analyze_token(
         self,
@@ -58,24 +207,47 @@ class CurveIntelligenceLayer:
         """
         Comprehensive token analysis
         
+        Concurrent calls for the same mint share one computation (and its
+        RPC requests); they all receive the same result dictionary.
+        
         Args:
             token_mint: Token mint address
             
         Returns:
             Dictionary with complete analysis
         """
-        # Get curve analysis
-        curve_analysis = await self.curve_analyzer.analyze_curve(token_mint)
-        
-        # Get risk assessment
-        risk_assessment = await self.risk_detector.assess_risk(token_mint, curve_analysis)
+        return await _single_flight(
+            self._inflight,
+            token_mint,
+            lambda: self._analyze_token(token_mint)
+        )
+    
+    async def _analyze_token(self, token_mint: Pubkey) -> Dict[str, Any]:
+        """
+        Run the full analysis pipeline for one token
         
-        # Detect patterns
-        patterns = await self.pattern_recognizer.detect_patterns(token_mint)
+        Args:
+            token_mint: Token mint address
+            
+        Returns:
+            Dictionary with complete analysis
+        """
+        # Pattern detection is independent of the curve, so it runs alongside
+        # the curve analysis -> risk assessment chain
+        patterns_task = asyncio.create_task(self.pattern_recognizer.detect_patterns(token_mint))
+        try:
+            curve_analysis = await self._get_curve(token_mint)
+            risk_assessment, patterns = await asyncio.gather(
+                self.risk_detector.assess_risk(token_mint, curve_analysis),
+                patterns_task
+            )
+        except BaseException:
+            patterns_task.cancel()
+            raise
         
         # Compile comprehensive analysis
         analysis = {
-            "token_mint": str(token_mint),
+            "token_mint": curve_analysis.token_mint,
             "curve_analysis": curve_analysis,
             "risk_assessment": risk_assessment,
             "patterns": patterns,
@@ -86,32 +258,32 @@ class CurveIntelligenceLayer:
         
         return analysis
     
-    def _get_arcium_client(self):
-        """Lazy import of Arcium bridge client"""
-        if self._arcium_client is None and self.use_confidential_intel:
-            try:
-                import sys
-                import os
-                bridge_path = os.path.join(
-                    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
-                    "evalys-arcium-bridge-service", "src"
-                )
-                if os.path.exists(bridge_path):
-                    sys.path.insert(0, os.path.dirname(bridge_path))
-                    from bridge.arcium_client import ArciumBridgeClient
-                    from bridge.models import SizingPreferences, UserConstraints, CurveMetrics
-                    self._arcium_client = {
-                        "client": ArciumBridgeClient,
-                        "models": {
-                            "SizingPreferences": SizingPreferences,
-                            "UserConstraints": UserConstraints,
-                            "CurveMetrics": CurveMetrics,
-                        }
-                    }
-            except ImportError:
-                logger.warning("Arcium bridge service not available for confidential intel")
-                self._arcium_client = False
-        return self._arcium_client
+    async def _get_curve(self, token_mint: Pubkey) -> CurveAnalysis:
+        """
+        Get the curve analysis, reusing one computed in the last few seconds
+        
+        Concurrent callers for the same mint share a single fetch.
+        
+        Args:
+            token_mint: Token mint address
+            
+        Returns:
+            CurveAnalysis instance
+        """
+        curve_analysis: Optional[CurveAnalysis] = self._curve_cache.get(token_mint)
+        if curve_analysis is not None:
+            return curve_analysis
+        
+        async def fetch() -> CurveAnalysis:
+            analysis = await self.curve_analyzer.analyze_curve(token_mint)
+            self._curve_cache[token_mint] = analysis
+            return analysis
+        
+        return await _single_flight(self._curve_inflight, token_mint, fetch)
+    
+    def _get_arcium_client(self) -> Optional[Dict[str, Any]]:
+        """Arcium bridge client class and models, if confidential intel is enabled"""
+        return _load_arcium() if self.use_confidential_intel else None
     
     async def get_confidential_curve_evaluation(
         self,
@@ -140,26 +312,24 @@ class CurveIntelligenceLayer:
         
         try:
             # Get public curve metrics
-            curve_analysis = await self.curve_analyzer.analyze_curve(token_mint)
-            
-            # Build curve metrics from analysis
-            curve_metrics = {
-                "current_price": int(curve_analysis.get("current_price", 0)),
-                "price_change_24h": int(curve_analysis.get("price_change_24h", 0)),
-                "liquidity_depth": int(curve_analysis.get("liquidity_depth", 0)),
-                "buy_pressure": int(curve_analysis.get("buy_pressure", 0)),
-                "sell_pressure": int(curve_analysis.get("sell_pressure", 0)),
-            }
+            curve_analysis = await self._get_curve(token_mint)
             
             # Build models
             client_class = arcium_client_info["client"]
             models = arcium_client_info["models"]
             
-            client = client_class()
+            # One long-lived client keeps its connections across evaluations
+            # (construction is synchronous, so concurrent callers cannot race here)
+            if self._arcium_live_client is None:
+                self._arcium_live_client = client_class()
+            client = self._arcium_live_client
             
             sizing = models["SizingPreferences"](**sizing_preferences)
             constraints = models["UserConstraints"](**user_constraints)
-            metrics = models["CurveMetrics"](**curve_metrics)
+            # Public curve metrics from the analysis
+            metrics = models["CurveMetrics"](
+                **{key: int(curve_analysis.get(key, 0)) for key in _METRIC_KEYS}
+            )
             
             # Get confidential evaluation
             recommendation = await client.get_curve_evaluation(
@@ -168,8 +338,6 @@ class CurveIntelligenceLayer:
                 curve_metrics=metrics,
             )
             
-            await client.close()
-            
             logger.info(f"Received confidential curve evaluation for {token_mint}")
             
             return {
@@ -261,9 +429,41 @@ class CurveIntelligenceLayer:
             time_window_minutes
         )
     
+    async def detect_patterns_batch(
+        self,
+        token_mints: List[Pubkey],
+        time_window_minutes: int = 30
+    ) -> Dict[Pubkey, list]:
+        """
+        Detect trading patterns for many tokens
+        
+        Args:
+            token_mints: Token mint addresses
+            time_window_minutes: Time window to analyze
+            
+        Returns:
+            Dictionary mapping each token mint to its detected patterns
+        """
+        return await self.pattern_recognizer.detect_patterns_batch(
+            token_mints,
+            time_window_minutes
+        )
+    
+    async def assess_risk_batch(self, token_mints: List[Pubkey]) -> Dict[Pubkey, Dict[str, Any]]:
+        """
+        Assess risk for many tokens
+        
+        Args:
+            token_mints: Token mint addresses
+            
+        Returns:
+            Dictionary mapping each token mint to its risk assessment
+        """
+        return await self.risk_detector.assess_risk_batch(token_mints)
+    
     async def assess_trade_impact(
         self,
-        token_mint: Pubkey,
+        token_mint: Union[Pubkey, str],
         amount: float,
         trade_type: str
     ) -> Dict[str, Any]:
@@ -271,7 +471,7 @@ class CurveIntelligenceLayer:
         Assess trade impact on curve
         
         Args:
-            token_mint: Token mint address
+            token_mint: Token mint address (Pubkey or base58 string)
             amount: Trade amount
             trade_type: "buy" or "sell"
             
@@ -286,6 +486,9 @@ class CurveIntelligenceLayer:
     
     async def close(self):
         """Close connections and cleanup"""
+        if self._arcium_live_client is not None:
+            await self._arcium_live_client.close()
+            self._arcium_live_client = None
         await self.data_collector.disconnect()
         logger.info("CurveIntelligenceLayer closed")
 
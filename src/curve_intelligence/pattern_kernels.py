@@ -0,0 +1,223 @@
+"""
+Pattern Kernels
+
+Fused numeric scan behind the pattern detectors.
+"""
+
+from dataclasses import dataclass
+import numpy as np
+from ..utils.jit import njit, NUMBA_AVAILABLE
+
+# Minimum sample sizes for each statistic
+MIN_BOT_TRANSACTIONS = 3
+MIN_TREND_TRANSACTIONS = 5
+MIN_TREND_PRICES = 3
+
+WHALE_MULTIPLIER = 5.0  # 5x average = whale
+ANOMALY_STD_DEVS = 3.0
+
+
+@dataclass(slots=True)
+class PatternScan:
+    """
+    Statistics of one transaction window
+
+    Statistics that do not apply (too few samples) are NaN.
+
+    Attributes:
+        whale_indices: Indices of whale transactions
+        whale_threshold: Amount at or above which a transaction is a whale
+        anomaly_indices: Indices of transactions with outlying amounts
+        amount_mean: Mean transaction amount
+        amount_std: Standard deviation of transaction amounts
+        avg_interval: Mean time between consecutive transactions
+        interval_variance: Variance of the time between transactions
+        avg_price_change: Mean relative change between consecutive prices
+    """
+    whale_indices: np.ndarray
+    whale_threshold: float
+    anomaly_indices: np.ndarray
+    amount_mean: float
+    amount_std: float
+    avg_interval: float
+    interval_variance: float
+    avg_price_change: float
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, boundscheck=False, nogil=True)
+    def _scan_kernel(amounts: np.ndarray, prices: np.ndarray, timestamps: np.ndarray):
+        """Compute every pattern statistic in one compiled call"""
+        n = amounts.size
+        nan = np.nan
+
+        # Amount statistics in one pass (Welford), plus the positive mean for whales
+        mean = 0.0
+        m2 = 0.0
+        positive_total = 0.0
+        positive_count = 0
+        for i in range(n):
+            amount = amounts[i]
+            delta = amount - mean
+            mean += delta / (i + 1)
+            m2 += delta * (amount - mean)
+            if amount > 0:
+                positive_total += amount
+                positive_count += 1
+
+        amount_mean = nan
+        amount_std = nan
+        if n > 0:
+            amount_mean = mean
+            amount_std = (m2 / n) ** 0.5
+
+        whale_threshold = nan
+        if positive_count > 0:
+            whale_threshold = positive_total / positive_count * WHALE_MULTIPLIER
+
+        # Whale and anomaly hits, written into preallocated index buffers
+        whale_indices = np.empty(n, dtype=np.int64)
+        anomaly_indices = np.empty(n, dtype=np.int64)
+        whale_count = 0
+        anomaly_count = 0
+        for i in range(n):
+            amount = amounts[i]
+            if positive_count > 0 and amount >= whale_threshold:
+                whale_indices[whale_count] = i
+                whale_count += 1
+            if amount_std > 0 and abs(amount - amount_mean) > amount_std * ANOMALY_STD_DEVS:
+                anomaly_indices[anomaly_count] = i
+                anomaly_count += 1
+
+        # Interval statistics over time-ordered timestamps (the collector
+        # delivers them oldest first, so sorting is normally skipped)
+        avg_interval = nan
+        interval_variance = nan
+        if timestamps.size >= MIN_BOT_TRANSACTIONS:
+            times = timestamps
+            for i in range(times.size - 1):
+                if times[i + 1] < times[i]:
+                    times = np.sort(timestamps)
+                    break
+            mean = 0.0
+            m2 = 0.0
+            for i in range(times.size - 1):
+                interval = times[i + 1] - times[i]
+                delta = interval - mean
+                mean += delta / (i + 1)
+                m2 += delta * (interval - mean)
+            avg_interval = mean
+            interval_variance = m2 / (times.size - 1)
+
+        # Relative change between consecutive positive prices
+        avg_price_change = nan
+        if prices.size >= MIN_TREND_TRANSACTIONS:
+            change_total = 0.0
+            change_count = 0
+            previous = 0.0
+            for i in range(prices.size):
+                price = prices[i]
+                if price > 0:
+                    if previous > 0:
+                        change_total += (price - previous) / previous
+                        change_count += 1
+                    previous = price
+            if change_count + 1 >= MIN_TREND_PRICES:
+                avg_price_change = change_total / change_count
+
+        return (
+            whale_indices[:whale_count],
+            whale_threshold,
+            anomaly_indices[:anomaly_count],
+            amount_mean,
+            amount_std,
+            avg_interval,
+            interval_variance,
+            avg_price_change,
+        )
+
+    # Pay the JIT compile (or cache load) cost at import, not on the first request
+    _scan_kernel(np.zeros(5), np.ones(5), np.arange(5, dtype=np.float64))
+
+else:
+    def _scan_kernel(amounts: np.ndarray, prices: np.ndarray, timestamps: np.ndarray):
+        """Compute every pattern statistic with NumPy reductions"""
+        nan = np.nan
+
+        amount_mean = amounts.mean() if amounts.size else nan
+        amount_std = amounts.std() if amounts.size else nan
+
+        positive = amounts[amounts > 0]
+        whale_threshold = positive.mean() * WHALE_MULTIPLIER if positive.size else nan
+        whale_indices = np.flatnonzero(amounts >= whale_threshold)
+
+        if amount_std > 0:
+            anomaly_indices = np.flatnonzero(
+                np.abs(amounts - amount_mean) > amount_std * ANOMALY_STD_DEVS
+            )
+        else:
+            anomaly_indices = np.empty(0, dtype=np.int64)
+
+        avg_interval = nan
+        interval_variance = nan
+        if timestamps.size >= MIN_BOT_TRANSACTIONS:
+            intervals = np.diff(timestamps)
+            if (intervals < 0).any():  # Out of order: fall back to sorting
+                intervals = np.diff(np.sort(timestamps))
+            avg_interval = intervals.mean()
+            interval_variance = intervals.var()
+
+        avg_price_change = nan
+        if prices.size >= MIN_TREND_TRANSACTIONS:
+            prices = prices[prices > 0]
+            if prices.size >= MIN_TREND_PRICES:
+                avg_price_change = (np.diff(prices) / prices[:-1]).mean()
+
+        return (
+            whale_indices,
+            whale_threshold,
+            anomaly_indices,
+            amount_mean,
+            amount_std,
+            avg_interval,
+            interval_variance,
+            avg_price_change,
+        )
+
+
+def scan_patterns(amounts: np.ndarray, prices: np.ndarray, timestamps: np.ndarray) -> PatternScan:
+    """
+    Scan a transaction window for pattern statistics
+
+    Uses a fused Numba kernel when numba is installed (releasing the GIL),
+    otherwise NumPy reductions.
+
+    Args:
+        amounts: Transaction amounts (float64)
+        prices: Transaction prices, 0 where unknown (float64)
+        timestamps: Transaction timestamps (float64)
+
+    Returns:
+        PatternScan with hit indices and summary statistics
+    """
+    (
+        whale_indices,
+        whale_threshold,
+        anomaly_indices,
+        amount_mean,
+        amount_std,
+        avg_interval,
+        interval_variance,
+        avg_price_change,
+    ) = _scan_kernel(amounts, prices, timestamps)
+
+    return PatternScan(
+        whale_indices=whale_indices,
+        whale_threshold=float(whale_threshold),
+        anomaly_indices=anomaly_indices,
+        amount_mean=float(amount_mean),
+        amount_std=float(amount_std),
+        avg_interval=float(avg_interval),
+        interval_variance=float(interval_variance),
+        avg_price_change=float(avg_price_change),
+    )
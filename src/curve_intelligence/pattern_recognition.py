@@ -4,17 +4,31 @@ Pattern Recognition
 Detects patterns in trading behavior: whales, bots, anomalies.
 """
 
-from enum import Enum
-from typing import List, Dict, Any, Optional
+import asyncio
+from typing import List, Dict, Any, Iterable, Optional
 from solders.pubkey import Pubkey
-from datetime import datetime
+from .pattern_kernels import PatternScan, scan_patterns
 from ..data.collectors import DataCollector
+from ..data.transactions import Transactions, transaction_column
+from ..utils.enums import StrEnum
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Transaction windows at least this large are scanned in a worker thread
+OFFLOAD_MIN_TRANSACTIONS = 4096
 
-class PatternType(str, Enum):
+
+def _scan_transactions(transactions: Transactions) -> PatternScan:
+    """Extract the numeric columns and run the fused pattern scan"""
+    return scan_patterns(
+        transaction_column(transactions, "amount"),
+        transaction_column(transactions, "price"),
+        transaction_column(transactions, "timestamp")
+    )
+
+
+class PatternType(StrEnum):
     """Pattern type enumeration"""
     WHALE_MOVEMENT = "whale_movement"
     BOT_ACTIVITY = "bot_activity"
@@ -23,11 +37,22 @@ class PatternType(str, Enum):
     ANOMALY = "anomaly"
 
 
+# Pattern "type" values, bound once. StrEnum members are str instances, so
+# they compare equal to and serialize as their string values
+_WHALE = PatternType.WHALE_MOVEMENT
+_BOT = PatternType.BOT_ACTIVITY
+_PUMP = PatternType.PUMP_PATTERN
+_DUMP = PatternType.DUMP_PATTERN
+_ANOMALY = PatternType.ANOMALY
+
+
 class PatternRecognizer:
     """
     Recognizes patterns in trading behavior
     """
     
+    __slots__ = ("data_collector",)
+    
     def __init__(self, data_collector: Optional[DataCollector] = None):
         """
         Initialize pattern recognizer
@@ -53,231 +78,228 @@ class PatternRecognizer:
         Returns:
             List of detected patterns
         """
-        if self.data_collector:
-            transactions = await self.data_collector.get_recent_transactions(
-                token_mint,
-                time_window_minutes
-            )
-        else:
-            transactions = []
-        
-        patterns = []
-        
-        # Detect whale movements
-        whale_patterns = self._detect_whale_movements(transactions)
-        patterns.extend(whale_patterns)
+        transactions = await self._fetch_transactions(token_mint, time_window_minutes)
+        return await self._detect_in_transactions(token_mint, transactions)
+    
+    async def detect_patterns_batch(
+        self,
+        token_mints: Iterable[Pubkey],
+        time_window_minutes: int = 30,
+        max_concurrency: int = 32
+    ) -> Dict[Pubkey, List[Dict[str, Any]]]:
+        """
+        Detect patterns for many tokens with concurrent transaction fetches
         
-        # Detect bot activity
-        bot_patterns = self._detect_bot_activity(transactions)
-        patterns.extend(bot_patterns)
+        Args:
+            token_mints: Token mint addresses (duplicates are fetched once)
+            time_window_minutes: Time window to analyze
+            max_concurrency: Maximum transaction fetches in flight at once
+            
+        Returns:
+            Dictionary mapping each token mint to its detected patterns
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
         
-        # Detect pump/dump patterns
-        pump_patterns = self._detect_pump_patterns(transactions)
-        patterns.extend(pump_patterns)
+        async def detect_one(token_mint: Pubkey) -> List[Dict[str, Any]]:
+            async with semaphore:
+                transactions = await self._fetch_transactions(token_mint, time_window_minutes)
+            return await self._detect_in_transactions(token_mint, transactions)
         
-        dump_patterns = self._detect_dump_patterns(transactions)
-        patterns.extend(dump_patterns)
+        token_mints = list(dict.fromkeys(token_mints))
+        results = await asyncio.gather(*(detect_one(token_mint) for token_mint in token_mints))
         
-        # Detect anomalies
-        anomalies = self._detect_anomalies(transactions)
-        patterns.extend(anomalies)
+        return dict(zip(token_mints, results))
+    
+    async def _fetch_transactions(
+        self,
+        token_mint: Pubkey,
+        time_window_minutes: int
+    ) -> Transactions:
+        """
+        Fetch recent transactions (none without a data collector)
         
-        logger.debug(f"Detected {len(patterns)} patterns for {token_mint}")
+        Args:
+            token_mint: Token mint address
+            time_window_minutes: Time window to fetch
+            
+        Returns:
+            Transactions, oldest first
+        """
+        if not self.data_collector:
+            return []
         
-        return patterns
+        return await self.data_collector.get_recent_transactions(
+            token_mint,
+            time_window_minutes
+        )
     
-    def _detect_whale_movements(
+    async def _detect_in_transactions(
         self,
-        transactions: List[Dict[str, Any]]
+        token_mint: Pubkey,
+        transactions: Transactions
     ) -> List[Dict[str, Any]]:
         """
-        Detect whale (large) movements
+        Run every detector over one token's transactions
         
         Args:
+            token_mint: Token mint address
             transactions: List of transactions
             
         Returns:
-            List of whale movement patterns
+            List of detected patterns
         """
-        patterns = []
-        
+        # Quiet tokens are common when polling many mints: skip the scan entirely
         if not transactions:
-            return patterns
-        
-        # Calculate average transaction size
-        amounts = [t.get("amount", 0) for t in transactions if t.get("amount", 0) > 0]
-        if not amounts:
-            return patterns
+            logger.debug("No transactions for %s, no patterns detected", token_mint)
+            return []
+        
+        # Numeric columns are extracted once and scanned in one fused pass.
+        # Large windows are scanned off the event loop; the compiled kernel
+        # releases the GIL, so the scan overlaps with other in-flight work
+        if len(transactions) >= OFFLOAD_MIN_TRANSACTIONS:
+            scan = await asyncio.to_thread(_scan_transactions, transactions)
+        else:
+            scan = _scan_transactions(transactions)
         
-        avg_amount = sum(amounts) / len(amounts)
-        threshold = avg_amount * 5  # 5x average = whale
+        # Whale movements, bot activity, pump/dump trend and anomalies,
+        # concatenated into the result in one step
+        patterns = [
+            *self._detect_whale_movements(transactions, scan),
+            *self._detect_bot_activity(transactions, scan),
+            *self._detect_trend(transactions, scan),
+            *self._detect_anomalies(transactions, scan),
+        ]
         
-        # Find whale transactions
-        for tx in transactions:
-            amount = tx.get("amount", 0)
-            if amount >= threshold:
-                patterns.append({
-                    "type": PatternType.WHALE_MOVEMENT.value,
-                    "timestamp": tx.get("timestamp", 0),
-                    "amount": amount,
-                    "wallet": tx.get("wallet", "unknown"),
-                    "confidence": min(1.0, amount / (threshold * 2))
-                })
+        logger.debug(f"Detected {len(patterns)} patterns for {token_mint}")
         
         return patterns
     
-    def _detect_bot_activity(
+    def _detect_whale_movements(
         self,
-        transactions: List[Dict[str, Any]]
+        transactions: Transactions,
+        scan: PatternScan
     ) -> List[Dict[str, Any]]:
         """
-        Detect bot activity patterns
+        Detect whale (large) movements
         
         Args:
             transactions: List of transactions
+            scan: Pattern statistics of the transactions
             
         Returns:
-            List of bot activity patterns
+            List of whale movement patterns
         """
-        patterns = []
-        
-        if len(transactions) < 3:
-            return patterns
-        
-        # Analyze timing patterns
-        times = sorted([t.get("timestamp", 0) for t in transactions])
-        intervals = [times[i+1] - times[i] for i in range(len(times)-1)]
+        confidence_scale = scan.whale_threshold * 2
         
-        # Very regular intervals suggest bots
-        if intervals:
-            avg_interval = sum(intervals) / len(intervals)
-            variance = sum((x - avg_interval) ** 2 for x in intervals) / len(intervals)
-            
-            # Low variance = regular pattern = likely bot
-            if variance < avg_interval * 0.1 and avg_interval < 60:  # Regular, frequent
-                patterns.append({
-                    "type": PatternType.BOT_ACTIVITY.value,
-                    "confidence": 0.8,
-                    "avg_interval": avg_interval,
-                    "variance": variance,
-                    "transaction_count": len(transactions)
-                })
+        # Emit records for the whale transactions found by the scan
+        patterns = []
+        for index in scan.whale_indices.tolist():
+            tx = transactions[index]
+            amount = tx.get("amount", 0)
+            patterns.append({
+                "type": _WHALE,
+                "timestamp": tx.get("timestamp", 0),
+                "amount": amount,
+                "wallet": tx.get("wallet", "unknown"),
+                "confidence": min(1.0, amount / confidence_scale)
+            })
         
         return patterns
     
-    def _detect_pump_patterns(
+    def _detect_bot_activity(
         self,
-        transactions: List[Dict[str, Any]]
+        transactions: Transactions,
+        scan: PatternScan
     ) -> List[Dict[str, Any]]:
         """
-        Detect pump patterns (rapid price increase)
+        Detect bot activity patterns
         
         Args:
             transactions: List of transactions
+            scan: Pattern statistics of the transactions
             
         Returns:
-            List of pump patterns
+            List of bot activity patterns
         """
         patterns = []
         
-        if len(transactions) < 5:
-            return patterns
-        
-        # Analyze price movements
-        prices = [t.get("price", 0) for t in transactions if t.get("price", 0) > 0]
-        
-        if len(prices) < 3:
-            return patterns
+        # Very regular intervals suggest bots (NaN if too few transactions)
+        avg_interval = scan.avg_interval
+        variance = scan.interval_variance
         
-        # Check for rapid increase
-        price_changes = [(prices[i+1] - prices[i]) / prices[i] for i in range(len(prices)-1)]
-        avg_change = sum(price_changes) / len(price_changes)
-        
-        # Rapid positive changes = pump
-        if avg_change > 0.1:  # 10% average increase
+        # Low variance = regular pattern = likely bot
+        if variance < avg_interval * 0.1 and avg_interval < 60:  # Regular, frequent
             patterns.append({
-                "type": PatternType.PUMP_PATTERN.value,
-                "confidence": min(1.0, avg_change * 5),
-                "avg_price_change": avg_change,
+                "type": _BOT,
+                "confidence": 0.8,
+                "avg_interval": avg_interval,
+                "variance": variance,
                 "transaction_count": len(transactions)
             })
         
         return patterns
     
-    def _detect_dump_patterns(
+    def _detect_trend(
         self,
-        transactions: List[Dict[str, Any]]
+        transactions: Transactions,
+        scan: PatternScan
     ) -> List[Dict[str, Any]]:
         """
-        Detect dump patterns (rapid price decrease)
+        Detect pump (rapid price increase) or dump (rapid decrease) patterns
         
         Args:
             transactions: List of transactions
+            scan: Pattern statistics of the transactions
             
         Returns:
-            List of dump patterns
+            List with at most one pump or dump pattern
         """
-        patterns = []
-        
-        if len(transactions) < 5:
-            return patterns
-        
-        # Analyze price movements
-        prices = [t.get("price", 0) for t in transactions if t.get("price", 0) > 0]
-        
-        if len(prices) < 3:
-            return patterns
-        
-        # Check for rapid decrease
-        price_changes = [(prices[i+1] - prices[i]) / prices[i] for i in range(len(prices)-1)]
-        avg_change = sum(price_changes) / len(price_changes)
+        avg_change = scan.avg_price_change
         
-        # Rapid negative changes = dump
-        if avg_change < -0.1:  # 10% average decrease
-            patterns.append({
-                "type": PatternType.DUMP_PATTERN.value,
-                "confidence": min(1.0, abs(avg_change) * 5),
-                "avg_price_change": avg_change,
-                "transaction_count": len(transactions)
-            })
-        
-        return patterns
+        # Rapid positive changes = pump, rapid negative changes = dump
+        if avg_change > 0.1:  # 10% average increase
+            pattern_type = _PUMP
+        elif avg_change < -0.1:  # 10% average decrease
+            pattern_type = _DUMP
+        else:
+            return []  # Also covers NaN (too few prices)
+        
+        return [{
+            "type": pattern_type,
+            "confidence": min(1.0, abs(avg_change) * 5),
+            "avg_price_change": avg_change,
+            "transaction_count": len(transactions)
+        }]
     
     def _detect_anomalies(
         self,
-        transactions: List[Dict[str, Any]]
+        transactions: Transactions,
+        scan: PatternScan
     ) -> List[Dict[str, Any]]:
         """
         Detect anomalies in transaction patterns
         
         Args:
             transactions: List of transactions
+            scan: Pattern statistics of the transactions
             
         Returns:
             List of anomalies
         """
-        patterns = []
-        
-        if not transactions:
-            return patterns
+        avg_amount = scan.amount_mean
+        std_dev = scan.amount_std
         
-        # Detect unusual transaction sizes
-        amounts = [t.get("amount", 0) for t in transactions]
-        if amounts:
-            avg_amount = sum(amounts) / len(amounts)
-            std_dev = (sum((x - avg_amount) ** 2 for x in amounts) / len(amounts)) ** 0.5
-            
-            # Transactions far from mean = anomaly
-            for tx in transactions:
-                amount = tx.get("amount", 0)
-                if std_dev > 0 and abs(amount - avg_amount) > std_dev * 3:
-                    patterns.append({
-                        "type": PatternType.ANOMALY.value,
-                        "timestamp": tx.get("timestamp", 0),
-                        "amount": amount,
-                        "deviation": abs(amount - avg_amount) / std_dev,
-                        "confidence": 0.7
-                    })
+        # Transactions far from mean = anomaly
+        anomalies = []
+        for index in scan.anomaly_indices.tolist():
+            tx = transactions[index]
+            amount = tx.get("amount", 0)
+            anomalies.append({
+                "type": _ANOMALY,
+                "timestamp": tx.get("timestamp", 0),
+                "amount": amount,
+                "deviation": abs(amount - avg_amount) / std_dev,
+                "confidence": 0.7
+            })
         
-        return patterns
-
+        return anomalies
@@ -4,17 +4,144 @@ Risk Detector
 Detects risks in bonding curves: snipers, buy clusters, liquidity risks.
 """
 
-from enum import Enum
-from typing import Dict, Any, List, Optional
+import time
+from bisect import bisect_left, bisect_right
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Sequence, Tuple
 from solders.pubkey import Pubkey
-from datetime import datetime, timedelta
+import numpy as np
 from ..data.collectors import DataCollector
+from ..data.transactions import Transactions, TxBatch, transaction_column
+from ..utils.enums import StrEnum
+from ..utils.jit import njit, NUMBA_AVAILABLE
 from ..utils.logger import get_logger
+from ..utils.timestamps import format_iso_timestamp
 
 logger = get_logger(__name__)
 
+# Default analysis windows (minutes)
+SNIPER_WINDOW_MINUTES = 5
+CLUSTER_WINDOW_MINUTES = 10
+ASSESSMENT_WINDOW_MINUTES = max(SNIPER_WINDOW_MINUTES, CLUSTER_WINDOW_MINUTES)
 
-class RiskLevel(str, Enum):
+CLUSTER_WINDOW_SECONDS = 60.0  # 1 minute clusters
+MIN_CLUSTER_TRANSACTIONS = 2
+
+
+@njit(cache=True, boundscheck=False, nogil=True)
+def _scan_window(timestamps: np.ndarray, amounts: np.ndarray, window: float, cutoff: float):
+    """
+    Group sorted transactions into clusters and find the sniper window in one pass
+    
+    A cluster starts at a transaction and takes every following transaction
+    within window seconds of that start. Only clusters of at least
+    MIN_CLUSTER_TRANSACTIONS are returned.
+    
+    Returns:
+        (first index, last index, transaction count, total volume) arrays of
+        the clusters, and the index of the first transaction at or after cutoff
+    """
+    n = timestamps.size
+    starts = np.empty(n, dtype=np.int64)
+    ends = np.empty(n, dtype=np.int64)
+    counts = np.empty(n, dtype=np.int64)
+    volumes = np.empty(n, dtype=np.float64)
+    found = 0
+    sniper_start = n
+    if timestamps[0] >= cutoff:
+        sniper_start = 0
+    
+    start = 0
+    volume = amounts[0]
+    for i in range(1, n + 1):
+        if i < n and sniper_start == n and timestamps[i] >= cutoff:
+            sniper_start = i
+        if i < n and timestamps[i] - timestamps[start] <= window:
+            volume += amounts[i]
+            continue
+        
+        # Close the current cluster (i == n flushes the last one)
+        if i - start >= MIN_CLUSTER_TRANSACTIONS:
+            starts[found] = start
+            ends[found] = i - 1
+            counts[found] = i - start
+            volumes[found] = volume
+            found += 1
+        if i < n:
+            start = i
+            volume = amounts[i]
+    
+    return starts[:found], ends[:found], counts[:found], volumes[:found], sniper_start
+
+
+if NUMBA_AVAILABLE:
+    # Pay the JIT compile (or cache load) cost at import, not on the first request
+    _scan_window(np.zeros(2), np.zeros(2), CLUSTER_WINDOW_SECONDS, 0.0)
+
+
+def _cluster_records(
+    timestamps: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    counts: np.ndarray,
+    volumes: np.ndarray
+) -> List[Dict[str, Any]]:
+    """Materialize cluster records from scan output over sorted timestamps"""
+    return [
+        {
+            "start_time": start_time,
+            "end_time": end_time,
+            "transaction_count": count,
+            "total_volume": volume
+        }
+        for start_time, end_time, count, volume in zip(
+            timestamps[starts].tolist(),
+            timestamps[ends].tolist(),
+            counts.tolist(),
+            volumes.tolist()
+        )
+    ]
+
+
+def _sorted_columns(transactions: Transactions, presorted: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get timestamp and amount columns in time order
+    
+    Args:
+        transactions: Non-empty transactions
+        presorted: Whether transactions are known to be oldest first
+        
+    Returns:
+        (timestamps, amounts) arrays sorted by timestamp
+    """
+    timestamps = transaction_column(transactions, "timestamp")
+    amounts = transaction_column(transactions, "amount")
+    # The O(n) order check is far cheaper than the sort it usually avoids
+    if not presorted and (np.diff(timestamps) < 0).any():
+        order = np.argsort(timestamps, kind="stable")  # Same order as sorted() on the dicts
+        timestamps = timestamps[order]
+        amounts = amounts[order]
+    return timestamps, amounts
+
+
+def _transactions_since(transactions: Transactions, cutoff: float) -> Transactions:
+    """
+    Slice oldest-first transactions down to those at or after cutoff
+    
+    Args:
+        transactions: Transactions sorted by timestamp, oldest first
+        cutoff: Earliest timestamp to keep (epoch seconds)
+        
+    Returns:
+        Trailing slice of transactions
+    """
+    if isinstance(transactions, TxBatch):
+        start = int(np.searchsorted(transactions.timestamps, cutoff, side="left"))
+    else:
+        start = bisect_left(transactions, cutoff, key=lambda tx: tx.get("timestamp", 0))
+    return transactions[start:]
+
+
+class RiskLevel(StrEnum):
     """Risk level enumeration"""
     LOW = "low"
     MEDIUM = "medium"
@@ -22,6 +149,35 @@ class RiskLevel(str, Enum):
     CRITICAL = "critical"
 
 
+# Lower bounds of the medium, high and critical levels for sniper
+# probability and overall risk score (ascending)
+_RISK_THRESHOLDS = (0.4, 0.6, 0.8)
+_RISK_LEVELS: Tuple[RiskLevel, ...] = (
+    RiskLevel.LOW,
+    RiskLevel.MEDIUM,
+    RiskLevel.HIGH,
+    RiskLevel.CRITICAL,
+)
+
+# Sniper indicators of a window without transactions (copied per result)
+_QUIET_SNIPER_INDICATORS = {
+    "probability": 0.0,
+    "transaction_count": 0,
+    "avg_time_between": 0.0,
+    "pattern_match": False
+}
+
+# Upper bounds of the critical, high and medium liquidity-ratio buckets
+# (ascending), and the (risk level, risk score) of each bucket
+_LIQUIDITY_THRESHOLDS = (0.1, 0.3, 0.5)
+_LIQUIDITY_OUTCOMES: Tuple[Tuple[RiskLevel, float], ...] = (
+    (RiskLevel.CRITICAL, 0.9),
+    (RiskLevel.HIGH, 0.7),
+    (RiskLevel.MEDIUM, 0.5),
+    (RiskLevel.LOW, 0.3),
+)
+
+
 class RiskDetector:
     """
     Detects risks in bonding curves
@@ -41,7 +197,9 @@ class RiskDetector:
     async def detect_sniper_window(
         self,
         token_mint: Pubkey,
-        time_window_minutes: int = 5
+        time_window_minutes: int = SNIPER_WINDOW_MINUTES,
+        transactions: Optional[Transactions] = None,
+        timestamp: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Detect if snipers are active
@@ -49,31 +207,47 @@ class RiskDetector:
         Args:
             token_mint: Token mint address
             time_window_minutes: Time window to analyze
+            transactions: Optional transactions in the window (fetches if not provided)
+            timestamp: Optional ISO timestamp for the result (now if not provided)
             
         Returns:
             Dictionary with sniper detection results
         """
-        if self.data_collector:
-            transactions = await self.data_collector.get_recent_transactions(
-                token_mint,
-                time_window_minutes
-            )
-        else:
-            transactions = self.transaction_history.get(str(token_mint), [])
+        if transactions is None:
+            transactions = await self._get_transactions(token_mint, time_window_minutes)
         
         # Analyze transaction patterns
         sniper_indicators = self._analyze_sniper_patterns(transactions, time_window_minutes)
         
+        return self._sniper_result(token_mint, sniper_indicators, timestamp)
+    
+    def _sniper_result(
+        self,
+        token_mint: Pubkey,
+        sniper_indicators: Dict[str, Any],
+        timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build a sniper detection result from its indicators
+        
+        Args:
+            token_mint: Token mint address
+            sniper_indicators: Sniper indicators of the window
+            timestamp: Optional ISO timestamp for the result (now if not provided)
+            
+        Returns:
+            Dictionary with sniper detection results
+        """
         is_active = sniper_indicators["probability"] > 0.6
         risk_level = self._calculate_sniper_risk(sniper_indicators["probability"])
         
         result = {
             "token_mint": str(token_mint),
             "is_active": is_active,
-            "risk_level": risk_level.value,
+            "risk_level": risk_level,
             "probability": sniper_indicators["probability"],
             "indicators": sniper_indicators,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": timestamp or format_iso_timestamp(time.time_ns() // 1_000_000)
         }
         
         logger.debug(
@@ -86,7 +260,8 @@ class RiskDetector:
     async def detect_buy_clusters(
         self,
         token_mint: Pubkey,
-        time_window_minutes: int = 10
+        time_window_minutes: int = CLUSTER_WINDOW_MINUTES,
+        transactions: Optional[Transactions] = None
     ) -> List[Dict[str, Any]]:
         """
         Detect buy clusters (grouped transactions)
@@ -94,20 +269,20 @@ class RiskDetector:
         Args:
             token_mint: Token mint address
             time_window_minutes: Time window to analyze
+            transactions: Optional transactions in the window (fetches if not provided)
             
         Returns:
             List of detected clusters
         """
-        if self.data_collector:
-            transactions = await self.data_collector.get_recent_transactions(
-                token_mint,
-                time_window_minutes
-            )
-        else:
-            transactions = self.transaction_history.get(str(token_mint), [])
-        
-        # Group transactions by time
-        clusters = self._identify_clusters(transactions, time_window_minutes)
+        if transactions is None:
+            transactions = await self._get_transactions(token_mint, time_window_minutes)
+        
+        # Group transactions by time (collector results are already oldest first)
+        clusters = self._identify_clusters(
+            transactions,
+            time_window_minutes,
+            presorted=self.data_collector is not None
+        )
         
         logger.debug(f"Detected {len(clusters)} buy clusters for {token_mint}")
         
@@ -116,7 +291,8 @@ class RiskDetector:
     async def assess_risk(
         self,
         token_mint: Pubkey,
-        curve_data: Optional[Dict[str, Any]] = None
+        curve_data: Optional[Mapping[str, Any]] = None,
+        transactions: Optional[Transactions] = None
     ) -> Dict[str, Any]:
         """
         Comprehensive risk assessment
@@ -124,15 +300,41 @@ class RiskDetector:
         Args:
             token_mint: Token mint address
             curve_data: Optional curve data
+            transactions: Optional transactions covering both analysis windows
+                (fetches if not provided)
             
         Returns:
-            Dictionary with risk assessment
+            Dictionary with risk assessment (risk levels are RiskLevel
+            members, which serialize as plain strings)
         """
-        # Detect sniper activity
-        sniper_result = await self.detect_sniper_window(token_mint)
+        # One fetch covers both windows; the sniper window is its most
+        # recent slice (the collector returns transactions oldest first)
+        if transactions is None:
+            transactions = await self._get_transactions(token_mint, ASSESSMENT_WINDOW_MINUTES)
         
-        # Detect buy clusters
-        clusters = await self.detect_buy_clusters(token_mint)
+        # One clock reading serves the sniper cutoff and both result timestamps
+        now_ms = time.time_ns() // 1_000_000
+        timestamp = format_iso_timestamp(now_ms)
+        
+        # Quiet mints are the common case when scanning: skip the analyses
+        if not transactions:
+            return self._quiet_assessment(token_mint, curve_data, timestamp)
+        
+        # Collector results cover both windows and are oldest first; local
+        # history may be unordered and is analyzed whole for snipers
+        if self.data_collector:
+            sniper_cutoff = now_ms / 1000 - SNIPER_WINDOW_MINUTES * 60
+        else:
+            sniper_cutoff = -np.inf
+        
+        # Sniper indicators and buy clusters from one scan of the transactions
+        sniper_indicators, clusters = self._scan_transactions(
+            transactions,
+            sniper_cutoff,
+            presorted=self.data_collector is not None
+        )
+        sniper_result = self._sniper_result(token_mint, sniper_indicators, timestamp)
+        logger.debug(f"Detected {len(clusters)} buy clusters for {token_mint}")
         
         # Assess liquidity risk
         liquidity_risk = self._assess_liquidity_risk(curve_data)
@@ -146,20 +348,178 @@ class RiskDetector:
         
         assessment = {
             "token_mint": str(token_mint),
-            "overall_risk": overall_risk.value,
+            "overall_risk": overall_risk,
             "sniper_activity": sniper_result,
             "buy_clusters": clusters,
             "liquidity_risk": liquidity_risk,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": timestamp
         }
         
         logger.info(f"Risk assessment for {token_mint}: {overall_risk.value}")
         
         return assessment
     
+    def _quiet_assessment(
+        self,
+        token_mint: Pubkey,
+        curve_data: Optional[Mapping[str, Any]],
+        timestamp: str
+    ) -> Dict[str, Any]:
+        """
+        Build the risk assessment of a token without recent transactions
+        
+        Args:
+            token_mint: Token mint address
+            curve_data: Optional curve data
+            timestamp: ISO timestamp for the results
+            
+        Returns:
+            Dictionary with risk assessment (no sniper activity or clusters)
+        """
+        mint = str(token_mint)
+        sniper_result = {
+            "token_mint": mint,
+            "is_active": False,
+            "risk_level": RiskLevel.LOW,
+            "probability": 0.0,
+            "indicators": _QUIET_SNIPER_INDICATORS.copy(),
+            "timestamp": timestamp
+        }
+        liquidity_risk = self._assess_liquidity_risk(curve_data)
+        overall_risk = self._calculate_overall_risk(sniper_result, (), liquidity_risk)
+        
+        logger.debug("No recent transactions for %s, overall risk %s", mint, overall_risk)
+        
+        return {
+            "token_mint": mint,
+            "overall_risk": overall_risk,
+            "sniper_activity": sniper_result,
+            "buy_clusters": [],
+            "liquidity_risk": liquidity_risk,
+            "timestamp": timestamp
+        }
+    
+    async def assess_risk_batch(
+        self,
+        token_mints: Iterable[Pubkey],
+        max_concurrency: int = 32
+    ) -> Dict[Pubkey, Dict[str, Any]]:
+        """
+        Assess risk for many tokens with one batched transaction fetch
+        
+        Args:
+            token_mints: Token mint addresses (duplicates are assessed once)
+            max_concurrency: Maximum transaction fetches in flight at once
+            
+        Returns:
+            Dictionary mapping each token mint to its risk assessment
+        """
+        token_mints = list(dict.fromkeys(token_mints))
+        
+        transactions_by_mint: Mapping[Pubkey, Transactions]
+        if self.data_collector:
+            transactions_by_mint = await self.data_collector.get_recent_transactions_batch(
+                token_mints,
+                ASSESSMENT_WINDOW_MINUTES,
+                max_concurrency=max_concurrency
+            )
+        else:
+            transactions_by_mint = {
+                token_mint: self.transaction_history.get(str(token_mint), [])
+                for token_mint in token_mints
+            }
+        
+        # The remaining work is CPU-bound, so assessments run back to back
+        return {
+            token_mint: await self.assess_risk(
+                token_mint,
+                transactions=transactions_by_mint[token_mint]
+            )
+            for token_mint in token_mints
+        }
+    
+    async def _get_transactions(
+        self,
+        token_mint: Pubkey,
+        time_window_minutes: int
+    ) -> Transactions:
+        """
+        Get recent transactions from the collector, or the local history
+        
+        Args:
+            token_mint: Token mint address
+            time_window_minutes: Time window in minutes
+            
+        Returns:
+            List of transactions
+        """
+        if self.data_collector:
+            return await self.data_collector.get_recent_transactions(
+                token_mint,
+                time_window_minutes
+            )
+        return self.transaction_history.get(str(token_mint), [])
+    
+    def _scan_transactions(
+        self,
+        transactions: Transactions,
+        sniper_cutoff: float,
+        presorted: bool = False
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Compute sniper indicators and buy clusters together
+        
+        With numba, one compiled pass over the time-ordered columns finds the
+        clusters and the start of the sniper window; otherwise the sniper and
+        cluster analyses run separately.
+        
+        Args:
+            transactions: Transactions covering both analysis windows
+            sniper_cutoff: Earliest timestamp in the sniper window (epoch seconds)
+            presorted: Whether transactions are known to be oldest first
+            
+        Returns:
+            (sniper indicators, buy clusters)
+        """
+        if not transactions:
+            return self._sniper_indicators(0, 0.0, SNIPER_WINDOW_MINUTES), []
+        
+        if not NUMBA_AVAILABLE:
+            sniper_transactions = transactions
+            if presorted:
+                sniper_transactions = _transactions_since(transactions, sniper_cutoff)
+            elif sniper_cutoff > -np.inf:
+                times = transaction_column(transactions, "timestamp")
+                sniper_transactions = [
+                    tx for tx, keep in zip(transactions, (times >= sniper_cutoff).tolist()) if keep
+                ]
+            return (
+                self._analyze_sniper_patterns(sniper_transactions, SNIPER_WINDOW_MINUTES),
+                self._identify_clusters_numpy(transactions, presorted)
+            )
+        
+        timestamps, amounts = _sorted_columns(transactions, presorted)
+        starts, ends, counts, volumes, sniper_start = _scan_window(
+            timestamps,
+            amounts,
+            CLUSTER_WINDOW_SECONDS,
+            sniper_cutoff
+        )
+        
+        # The sniper window is the sorted suffix from sniper_start
+        sniper_count = timestamps.size - sniper_start
+        avg_interval = 0
+        if sniper_count > 1:
+            avg_interval = float(timestamps[-1] - timestamps[sniper_start]) / (sniper_count - 1)
+        
+        return (
+            self._sniper_indicators(sniper_count, avg_interval, SNIPER_WINDOW_MINUTES),
+            _cluster_records(timestamps, starts, ends, counts, volumes)
+        )
+    
     def _analyze_sniper_patterns(
         self,
-        transactions: List[Dict[str, Any]],
+        transactions: Transactions,
         time_window: int
     ) -> Dict[str, Any]:
         """
@@ -172,30 +532,42 @@ class RiskDetector:
         Returns:
             Dictionary with sniper indicators
         """
-        if not transactions:
-            return {
-                "probability": 0.0,
-                "transaction_count": 0,
-                "avg_time_between": 0.0,
-                "pattern_match": False
-            }
+        # Calculate average time between transactions
+        if len(transactions) > 1:
+            times = transaction_column(transactions, "timestamp")
+            # Consecutive gaps of the sorted times sum to max - min, so their
+            # mean needs no sort
+            avg_interval = float(np.ptp(times)) / (times.size - 1)
+        else:
+            avg_interval = 0
+        
+        return self._sniper_indicators(len(transactions), avg_interval, time_window)
+    
+    def _sniper_indicators(
+        self,
+        transaction_count: int,
+        avg_interval: float,
+        time_window: int
+    ) -> Dict[str, Any]:
+        """
+        Score sniper activity from transaction count and spacing
+        
+        Args:
+            transaction_count: Transactions in the window
+            avg_interval: Average time between transactions (seconds)
+            time_window: Time window in minutes
+            
+        Returns:
+            Dictionary with sniper indicators
+        """
+        if not transaction_count:
+            return _QUIET_SNIPER_INDICATORS.copy()
         
-        # Calculate indicators
-        transaction_count = len(transactions)
         time_span = time_window * 60  # Convert to seconds
         
         # High transaction frequency suggests snipers
         frequency = transaction_count / time_span if time_span > 0 else 0
         
-        # Calculate average time between transactions
-        if len(transactions) > 1:
-            times = [t.get("timestamp", 0) for t in transactions]
-            times.sort()
-            intervals = [times[i+1] - times[i] for i in range(len(times)-1)]
-            avg_interval = sum(intervals) / len(intervals) if intervals else 0
-        else:
-            avg_interval = 0
-        
         # Pattern matching (simplified)
         # Real implementation would use ML or more sophisticated pattern matching
         pattern_match = frequency > 0.1 and avg_interval < 10  # High frequency, low interval
@@ -211,10 +583,23 @@ class RiskDetector:
             "pattern_match": pattern_match
         }
     
+    def _calculate_sniper_risk(self, probability: float) -> RiskLevel:
+        """
+        Map sniper probability to a risk level
+        
+        Args:
+            probability: Sniper probability (0.0 to 1.0)
+            
+        Returns:
+            Sniper risk level
+        """
+        return _RISK_LEVELS[bisect_right(_RISK_THRESHOLDS, probability)]
+    
     def _identify_clusters(
         self,
-        transactions: List[Dict[str, Any]],
-        time_window: int
+        transactions: Transactions,
+        time_window: int,
+        presorted: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Identify transaction clusters
@@ -222,6 +607,8 @@ class RiskDetector:
         Args:
             transactions: List of transactions
             time_window: Time window in minutes
+            presorted: Whether transactions are known to be oldest first
+                (skips the order check)
             
         Returns:
             List of clusters
@@ -229,50 +616,57 @@ class RiskDetector:
         if not transactions:
             return []
         
-        # Group transactions by time windows
-        clusters = []
-        cluster_window_seconds = 60  # 1 minute clusters
+        if not NUMBA_AVAILABLE:
+            return self._identify_clusters_numpy(transactions, presorted)
         
-        # Sort by timestamp
-        sorted_txs = sorted(transactions, key=lambda t: t.get("timestamp", 0))
+        timestamps, amounts = _sorted_columns(transactions, presorted)
+        starts, ends, counts, volumes, _ = _scan_window(
+            timestamps,
+            amounts,
+            CLUSTER_WINDOW_SECONDS,
+            np.inf
+        )
         
-        current_cluster = []
-        cluster_start = None
+        # Materialize records only for the clusters found
+        return _cluster_records(timestamps, starts, ends, counts, volumes)
+    
+    def _identify_clusters_numpy(
+        self,
+        transactions: Transactions,
+        presorted: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Identify transaction clusters with NumPy (used without numba)
         
-        for tx in sorted_txs:
-            tx_time = tx.get("timestamp", 0)
+        Args:
+            transactions: Non-empty transactions
+            presorted: Whether transactions are known to be oldest first
             
-            if cluster_start is None:
-                cluster_start = tx_time
-                current_cluster = [tx]
-            elif tx_time - cluster_start <= cluster_window_seconds:
-                current_cluster.append(tx)
-            else:
-                # Save cluster
-                if len(current_cluster) >= 2:  # At least 2 transactions
-                    clusters.append({
-                        "start_time": cluster_start,
-                        "end_time": current_cluster[-1].get("timestamp", 0),
-                        "transaction_count": len(current_cluster),
-                        "total_volume": sum(t.get("amount", 0) for t in current_cluster)
-                    })
-                
-                # Start new cluster
+        Returns:
+            List of clusters
+        """
+        timestamps, amounts = _sorted_columns(transactions, presorted)
+        
+        # Find cluster boundaries: a cluster takes every transaction within
+        # CLUSTER_WINDOW_SECONDS of its first one
+        times = timestamps.tolist()
+        start_list = [0]
+        cluster_start = times[0]
+        for i, tx_time in enumerate(times):
+            if tx_time - cluster_start > CLUSTER_WINDOW_SECONDS:
+                start_list.append(i)
                 cluster_start = tx_time
-                current_cluster = [tx]
         
-        # Save last cluster
-        if len(current_cluster) >= 2:
-            clusters.append({
-                "start_time": cluster_start,
-                "end_time": current_cluster[-1].get("timestamp", 0),
-                "transaction_count": len(current_cluster),
-                "total_volume": sum(t.get("amount", 0) for t in current_cluster)
-            })
+        # Every cluster's volume in one reduction
+        starts = np.array(start_list, dtype=np.int64)
+        ends = np.append(starts[1:], len(times)) - 1
+        counts = ends - starts + 1
+        volumes = np.add.reduceat(amounts, starts)
         
-        return clusters
+        keep = counts >= MIN_CLUSTER_TRANSACTIONS
+        return _cluster_records(timestamps, starts[keep], ends[keep], counts[keep], volumes[keep])
     
-    def _assess_liquidity_risk(self, curve_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    def _assess_liquidity_risk(self, curve_data: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
         """
         Assess liquidity risk
         
@@ -284,7 +678,7 @@ class RiskDetector:
         """
         if not curve_data:
             return {
-                "risk_level": RiskLevel.MEDIUM.value,
+                "risk_level": RiskLevel.MEDIUM,
                 "liquidity": 0.0,
                 "risk_score": 0.5
             }
@@ -298,22 +692,11 @@ class RiskDetector:
         else:
             ratio = 0.0
         
-        # Assess risk
-        if ratio < 0.1:
-            risk_level = RiskLevel.CRITICAL
-            risk_score = 0.9
-        elif ratio < 0.3:
-            risk_level = RiskLevel.HIGH
-            risk_score = 0.7
-        elif ratio < 0.5:
-            risk_level = RiskLevel.MEDIUM
-            risk_score = 0.5
-        else:
-            risk_level = RiskLevel.LOW
-            risk_score = 0.3
+        # Assess risk (a ratio equal to a bound falls in the next, safer bucket)
+        risk_level, risk_score = _LIQUIDITY_OUTCOMES[bisect_right(_LIQUIDITY_THRESHOLDS, ratio)]
         
         return {
-            "risk_level": risk_level.value,
+            "risk_level": risk_level,
             "liquidity": liquidity,
             "liquidity_ratio": ratio,
             "risk_score": risk_score
@@ -322,7 +705,7 @@ class RiskDetector:
     def _calculate_overall_risk(
         self,
         sniper_result: Dict[str, Any],
-        clusters: List[Dict[str, Any]],
+        clusters: Sequence[Dict[str, Any]],
         liquidity_risk: Dict[str, Any]
     ) -> RiskLevel:
         """
@@ -348,13 +731,6 @@ class RiskDetector:
             liquidity_risk_score * 0.3
         )
         
-        # Determine risk level
-        if overall_score >= 0.8:
-            return RiskLevel.CRITICAL
-        elif overall_score >= 0.6:
-            return RiskLevel.HIGH
-        elif overall_score >= 0.4:
-            return RiskLevel.MEDIUM
-        else:
-            return RiskLevel.LOW
+        # Determine risk level (a score equal to a threshold gets the higher level)
+        return _RISK_LEVELS[bisect_right(_RISK_THRESHOLDS, overall_score)]
 
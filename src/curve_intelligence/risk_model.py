@@ -0,0 +1,102 @@
+"""
+Risk Model
+
+Risk score weights and level thresholds from the v0.1 risk model
+(docs/risk-model.md).
+"""
+
+from bisect import bisect_right
+from typing import Sequence, Tuple
+import numpy as np
+from .risk_detector import RiskLevel
+from ..config.settings import Settings
+
+# Weights of the sniper, volatility, velocity and inverse-liquidity components
+RISK_WEIGHTS = (0.35, 0.25, 0.20, 0.20)
+
+MEDIUM_RISK_THRESHOLD = 0.35
+
+# Lower bounds of the medium, high and critical levels (ascending)
+RISK_THRESHOLDS = (
+    MEDIUM_RISK_THRESHOLD,
+    Settings.HIGH_RISK_THRESHOLD,
+    Settings.CRITICAL_RISK_THRESHOLD,
+)
+RISK_LEVELS: Tuple[RiskLevel, ...] = (
+    RiskLevel.LOW,
+    RiskLevel.MEDIUM,
+    RiskLevel.HIGH,
+    RiskLevel.CRITICAL,
+)
+
+_WEIGHTS = np.array(RISK_WEIGHTS, dtype=np.float64)
+_THRESHOLDS = np.array(RISK_THRESHOLDS, dtype=np.float64)
+_LEVELS = np.array([level.value for level in RISK_LEVELS])
+
+
+def score_risk(
+    sniper_score: float,
+    volatility: float,
+    velocity_norm: float,
+    liquidity_risk_inv: float
+) -> float:
+    """
+    Combine risk components into a risk score
+
+    Args:
+        sniper_score: Sniper activity (0.0 to 1.0)
+        volatility: Price volatility (0.0 to 1.0)
+        velocity_norm: Normalized transaction velocity (0.0 to 1.0)
+        liquidity_risk_inv: Inverse liquidity depth (0.0 to 1.0)
+
+    Returns:
+        Risk score (0.0 to 1.0)
+    """
+    w_sniper, w_volatility, w_velocity, w_liquidity = RISK_WEIGHTS
+    return (
+        w_sniper * sniper_score +
+        w_volatility * volatility +
+        w_velocity * velocity_norm +
+        w_liquidity * liquidity_risk_inv
+    )
+
+
+def score_risk_batch(features: np.ndarray) -> np.ndarray:
+    """
+    Score many tokens in one vectorized pass
+
+    Args:
+        features: (N, 4) array of sniper, volatility, velocity and
+            inverse-liquidity components per token
+
+    Returns:
+        Array of N risk scores
+    """
+    return np.asarray(features, dtype=np.float64) @ _WEIGHTS
+
+
+def classify_risk(risk_score: float) -> RiskLevel:
+    """
+    Map a risk score to its risk level
+
+    Args:
+        risk_score: Risk score (0.0 to 1.0)
+
+    Returns:
+        Risk level (a score equal to a threshold gets the higher level)
+    """
+    return RISK_LEVELS[bisect_right(RISK_THRESHOLDS, risk_score)]
+
+
+def classify_risk_batch(risk_scores: Sequence[float]) -> np.ndarray:
+    """
+    Map many risk scores to risk levels in one vectorized pass
+
+    Args:
+        risk_scores: Risk scores (0.0 to 1.0)
+
+    Returns:
+        Array of risk level strings ("low", "medium", "high", "critical")
+    """
+    scores = np.asarray(risk_scores, dtype=np.float64)
+    return _LEVELS[np.searchsorted(_THRESHOLDS, scores, side="right")]
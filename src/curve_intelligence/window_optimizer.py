@@ -4,9 +4,10 @@ Window Optimizer
 Calculates optimal execution windows for transactions.
 """
 
+import asyncio
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, Mapping, Tuple, Union
+from datetime import datetime, timedelta, timezone
 from solders.pubkey import Pubkey
 from .risk_detector import RiskDetector, RiskLevel
 from .curve_analyzer import CurveAnalyzer
@@ -14,8 +15,67 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_UTC = timezone.utc
 
-@dataclass
+# Risk level by its string value (unknown strings fall back to medium).
+# RiskLevel members hash and compare as their values, so assessments from
+# RiskDetector, which carry the members themselves, resolve to the same keys
+_RISK_FROM_STR = {level.value: level for level in RiskLevel}
+
+# Window length and maximum wait in minutes per risk level (higher risk = shorter window)
+_WINDOW_TABLES = {
+    RiskLevel.CRITICAL: (5, 10),
+    RiskLevel.HIGH: (10, 15),
+    RiskLevel.MEDIUM: (15, 20),
+    RiskLevel.LOW: (20, 30),
+}
+
+# The same tables specialized at import: (window duration, offset of the
+# window middle, maximum wait minutes, maximum wait)
+_WINDOW_DELTAS = {
+    level: (
+        timedelta(minutes=window_minutes),
+        timedelta(minutes=window_minutes) / 2,
+        wait_minutes,
+        timedelta(minutes=wait_minutes),
+    )
+    for level, (window_minutes, wait_minutes) in _WINDOW_TABLES.items()
+}
+
+# Base confidence per risk level, indexed by _RISK_INDEX (low, medium, high,
+# critical): lower risk = higher confidence
+_RISK_INDEX = {level: index for index, level in enumerate(RiskLevel)}
+_RISK_SCORE = (0.9, 0.7, 0.5, 0.3)
+
+
+def _compute_window_scalars(
+    risk_index: int,
+    sniper_prob: float,
+    volatility: float,
+    liquidity_depth: float
+) -> Tuple[float, float]:
+    """
+    Compute the numeric parts of an execution window
+
+    Args:
+        risk_index: Risk level index (see _RISK_INDEX)
+        sniper_prob: Sniper probability (0.0 to 1.0)
+        volatility: Curve volatility (0.0 to 1.0)
+        liquidity_depth: Curve liquidity depth (0.0 to 1.0)
+
+    Returns:
+        (expected slippage, confidence)
+    """
+    # Higher volatility and lower liquidity = higher slippage
+    expected_slippage = (volatility * 0.6 + (1 - liquidity_depth) * 0.4) * 0.1  # Max 10%
+
+    # Reduce confidence if snipers active
+    confidence = _RISK_SCORE[risk_index] * (1 - sniper_prob * 0.3)
+
+    return expected_slippage, confidence
+
+
+@dataclass(slots=True, frozen=True)
 class ExecutionWindow:
     """
     Execution window data structure
@@ -78,11 +138,11 @@ class WindowOptimizer:
         Returns:
             ExecutionWindow instance
         """
-        # Get risk assessment
-        risk_assessment = await self.risk_detector.assess_risk(token_mint)
-        
-        # Get curve analysis
-        curve_analysis = await self.curve_analyzer.analyze_curve(token_mint)
+        # Risk assessment and curve analysis are independent: fetch concurrently
+        risk_assessment, curve_analysis = await asyncio.gather(
+            self.risk_detector.assess_risk(token_mint),
+            self.curve_analyzer.analyze_curve(token_mint)
+        )
         
         # Calculate optimal window
         window = self._calculate_window(
@@ -103,7 +163,7 @@ class WindowOptimizer:
     def _calculate_window(
         self,
         risk_assessment: Dict[str, Any],
-        curve_analysis: Dict[str, Any],
+        curve_analysis: Mapping[str, Any],
         intent: str,
         amount: float,
         max_wait: int
@@ -121,55 +181,34 @@ class WindowOptimizer:
         Returns:
             ExecutionWindow instance
         """
-        now = datetime.utcnow()
+        now = datetime.now(_UTC)
         
-        # Get risk level
-        overall_risk_str = risk_assessment.get("overall_risk", "medium")
-        try:
-            risk_level = RiskLevel(overall_risk_str)
-        except ValueError:
-            risk_level = RiskLevel.MEDIUM
+        # Get risk level (a RiskLevel member, or its string from external input)
+        overall_risk = risk_assessment.get("overall_risk", RiskLevel.MEDIUM)
+        risk_level = _RISK_FROM_STR.get(overall_risk, RiskLevel.MEDIUM)
         
         # Get sniper activity
         sniper_result = risk_assessment.get("sniper_activity", {})
         sniper_prob = sniper_result.get("probability", 0.5)
         
-        # Calculate window duration based on risk
-        if risk_level == RiskLevel.CRITICAL:
-            window_duration = timedelta(minutes=5)  # Short window, high risk
-            wait_time = timedelta(minutes=min(10, max_wait))
-        elif risk_level == RiskLevel.HIGH:
-            window_duration = timedelta(minutes=10)
-            wait_time = timedelta(minutes=min(15, max_wait))
-        elif risk_level == RiskLevel.MEDIUM:
-            window_duration = timedelta(minutes=15)
-            wait_time = timedelta(minutes=min(20, max_wait))
-        else:  # LOW
-            window_duration = timedelta(minutes=20)
-            wait_time = timedelta(minutes=min(30, max_wait))
-        
-        # Calculate expected slippage
-        volatility = curve_analysis.get("volatility", 0.5)
-        liquidity_depth = curve_analysis.get("liquidity_depth", 0.5)
-        
-        # Higher volatility and lower liquidity = higher slippage
-        expected_slippage = (volatility * 0.6 + (1 - liquidity_depth) * 0.4) * 0.1  # Max 10%
-        
-        # Calculate confidence
-        # Lower risk and better conditions = higher confidence
-        risk_score = {
-            RiskLevel.LOW: 0.9,
-            RiskLevel.MEDIUM: 0.7,
-            RiskLevel.HIGH: 0.5,
-            RiskLevel.CRITICAL: 0.3
-        }[risk_level]
-        
-        confidence = risk_score * (1 - sniper_prob * 0.3)  # Reduce confidence if snipers active
+        # Window timing for this risk level (a new timedelta only when
+        # max_wait is shorter than the level's usual wait)
+        window_duration, half_window, wait_minutes, wait_time = _WINDOW_DELTAS[risk_level]
+        if max_wait < wait_minutes:
+            wait_time = timedelta(minutes=max_wait)
+        
+        # Slippage and confidence
+        expected_slippage, confidence = _compute_window_scalars(
+            _RISK_INDEX[risk_level],
+            sniper_prob,
+            curve_analysis.get("volatility", 0.5),
+            curve_analysis.get("liquidity_depth", 0.5)
+        )
         
         # Optimal time is start of window (can be adjusted)
         start_time = now + wait_time
         end_time = start_time + window_duration
-        optimal_time = start_time + (window_duration / 2)  # Middle of window
+        optimal_time = start_time + half_window  # Middle of window
         
         return ExecutionWindow(
             start_time=start_time,
@@ -183,7 +222,7 @@ class WindowOptimizer:
     
     async def assess_trade_impact(
         self,
-        token_mint: Pubkey,
+        token_mint: Union[Pubkey, str],
         amount: float,
         trade_type: str  # "buy" or "sell"
     ) -> Dict[str, Any]:
@@ -191,7 +230,7 @@ class WindowOptimizer:
         Assess impact of a trade on the curve
         
         Args:
-            token_mint: Token mint address
+            token_mint: Token mint address (Pubkey or base58 string)
             amount: Trade amount
             trade_type: Type of trade
             
@@ -216,12 +255,17 @@ class WindowOptimizer:
         # Estimate slippage
         slippage = min(0.1, price_impact / current_price) if current_price > 0 else 0.1
         
+        if trade_type == "buy":
+            liquidity_after = max(0, liquidity - amount)
+        else:
+            liquidity_after = liquidity + amount
+        
         return {
-            "token_mint": str(token_mint),
+            "token_mint": curve_analysis.token_mint,
             "trade_type": trade_type,
             "amount": amount,
             "estimated_price_impact": price_impact,
             "estimated_slippage": slippage,
-            "liquidity_after": max(0, liquidity - amount) if trade_type == "buy" else liquidity + amount
+            "liquidity_after": liquidity_after
         }
 
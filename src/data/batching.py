@@ -0,0 +1,121 @@
+"""
+Batching RPC Client
+
+Coalesces concurrent account lookups into getMultipleAccounts requests.
+"""
+
+import asyncio
+from typing import List, Optional, Set, Tuple
+from solders.account import Account
+from solders.pubkey import Pubkey
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Commitment
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# getMultipleAccounts accepts at most 100 pubkeys per request
+MAX_BATCH_SIZE = 100
+
+
+class BatchingRpcClient:
+    """
+    Buffers get_account calls and flushes them as one getMultipleAccounts
+
+    Calls made within max_delay_seconds of each other (or until
+    max_batch_size keys are queued) share a single RPC round-trip.
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        commitment: Optional[Commitment] = None,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_delay_seconds: float = 0.005
+    ):
+        """
+        Initialize batching client
+
+        Args:
+            client: Solana RPC client used to send batches
+            commitment: Commitment level for account queries
+            max_batch_size: Maximum pubkeys per batch (capped at 100)
+            max_delay_seconds: Maximum time a call waits for its batch to fill
+        """
+        self.client = client
+        self.commitment = commitment
+        self.max_batch_size = min(max_batch_size, MAX_BATCH_SIZE)
+        self.max_delay_seconds = max_delay_seconds
+        self._pending: List[Tuple[Pubkey, "asyncio.Future[Optional[Account]]"]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    async def get_account(self, pubkey: Pubkey) -> Optional[Account]:
+        """
+        Get account info, batched with concurrent callers
+
+        Args:
+            pubkey: Account address
+
+        Returns:
+            Account, or None if the account does not exist
+        """
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Optional[Account]]" = loop.create_future()
+        self._pending.append((pubkey, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_delay_seconds, self._flush)
+
+        return await future
+
+    def _flush(self):
+        """Send all pending lookups, max_batch_size keys per request"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        while self._pending:
+            batch = self._pending[:self.max_batch_size]
+            self._pending = self._pending[self.max_batch_size:]
+            task = asyncio.ensure_future(self._send(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, batch: List[Tuple[Pubkey, "asyncio.Future[Optional[Account]]"]]):
+        """
+        Send one getMultipleAccounts request and resolve its callers
+
+        Args:
+            batch: Queued (pubkey, future) pairs
+        """
+        # Duplicate lookups of the same account share one slot in the request
+        pubkeys = list(dict.fromkeys(pubkey for pubkey, _ in batch))
+
+        try:
+            response = await self.client.get_multiple_accounts(
+                pubkeys,
+                commitment=self.commitment
+            )
+        except Exception as e:
+            logger.error(f"Error fetching account batch ({len(pubkeys)} accounts): {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Results come back in request order
+        accounts = dict(zip(pubkeys, response.value))
+        for pubkey, future in batch:
+            if not future.done():
+                future.set_result(accounts.get(pubkey))
+
+        logger.debug(f"Resolved {len(batch)} account lookups with {len(pubkeys)}-key batch")
+
+    async def close(self):
+        """Flush pending lookups and wait for in-flight batches"""
+        self._flush()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
@@ -4,15 +4,41 @@ Data Collectors
 Collects data from launchpads and on-chain sources.
 """
 
-from typing import List, Dict, Any, Optional
+import asyncio
+import math
+import time
+from typing import List, Dict, Any, Iterable, Optional
+from solders.account import Account
 from solders.pubkey import Pubkey
 from solana.rpc.async_api import AsyncClient
-from solana.rpc.commitment import Confirmed
-from datetime import datetime, timedelta
+from solana.rpc.commitment import Commitment
+from .batching import BatchingRpcClient
+from .price_history import PriceHistory
+from .transactions import TxBatch
+from ..utils.cache import TTLCache, async_ttl_cache
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in the RPC provider's HTTP client)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Connection pool for RPC traffic; HTTP/2 multiplexes concurrent calls
+RPC_MAX_CONNECTIONS = 256
+RPC_MAX_KEEPALIVE_CONNECTIONS = 64
+RPC_TIMEOUT_SECONDS = 10.0
+
+# Repeated fetches of the same mint within this window share one RPC round-trip
+FETCH_CACHE_SIZE = 1024
+FETCH_CACHE_TTL_SECONDS = 2.0
+
+# Mints whose price history is kept (least recently ticked evicted first);
+# each history preallocates 128 KiB, so this caps them at 64 MiB
+PRICE_HISTORY_SIZE = 512
+
 
 class DataCollector:
     """
@@ -28,25 +54,100 @@ class DataCollector:
         """
         self.rpc_url = rpc_url
         self.client: Optional[AsyncClient] = None
+        self.batch_client: Optional[BatchingRpcClient] = None
+        # Mint -> PriceHistory
+        self.price_histories: TTLCache = TTLCache(maxsize=PRICE_HISTORY_SIZE, ttl=math.inf)
+        # Serializes connect/disconnect so concurrent callers share one client
+        self._connection_lock = asyncio.Lock()
         logger.info(f"DataCollector initialized with RPC: {rpc_url}")
     
-    async def connect(self):
-        """Connect to Solana RPC"""
-        if self.client is None:
-            self.client = AsyncClient(self.rpc_url)
-            logger.debug("Connected to Solana RPC")
+    async def __aenter__(self) -> "DataCollector":
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.disconnect()
+    
+    async def connect(self) -> BatchingRpcClient:
+        """
+        Connect to Solana RPC (safe to call concurrently)
+        
+        Returns:
+            Batching client for the live connection
+        """
+        batch_client = self.batch_client
+        if batch_client is not None:
+            return batch_client
+        
+        async with self._connection_lock:
+            if self.batch_client is None:
+                # Pooled keep-alive connections, configured through the
+                # client so its error handling and transport retries still apply
+                client = AsyncClient(
+                    self.rpc_url,
+                    timeout=RPC_TIMEOUT_SECONDS,
+                    max_connections=RPC_MAX_CONNECTIONS,
+                    max_keepalive_connections=RPC_MAX_KEEPALIVE_CONNECTIONS,
+                    http2=HTTP2_AVAILABLE
+                )
+                self.client = client
+                # Published last, so callers skipping the lock see a complete client
+                self.batch_client = BatchingRpcClient(client, commitment=Commitment.CONFIRMED)
+                logger.debug("Connected to Solana RPC")
+            return self.batch_client
     
     async def disconnect(self):
         """Disconnect from Solana RPC"""
-        if self.client:
-            await self.client.close()
-            self.client = None
-            logger.debug("Disconnected from Solana RPC")
+        async with self._connection_lock:
+            # Unpublished before closing, so concurrent connects build a new
+            # client instead of handing out the one being closed
+            batch_client, self.batch_client = self.batch_client, None
+            client, self.client = self.client, None
+            if batch_client:
+                await batch_client.close()
+            if client:
+                await client.close()
+                logger.debug("Disconnected from Solana RPC")
+    
+    async def get_account_info(self, pubkey: Pubkey) -> Optional[Account]:
+        """
+        Get account info
+        
+        Concurrent calls are coalesced into a single getMultipleAccounts
+        request by the batching client.
+        
+        Args:
+            pubkey: Account address
+            
+        Returns:
+            Account, or None if the account does not exist
+        """
+        batch_client = await self.connect()
+        return await batch_client.get_account(pubkey)
+    
+    def record_price_change(self, token_mint: Pubkey, price_change: float):
+        """
+        Record a price tick for a token
+        
+        Args:
+            token_mint: Token mint address
+            price_change: Relative price change since the previous tick
+        """
+        history = self.price_histories.get(token_mint)
+        if history is None:
+            history = self.price_histories[token_mint] = PriceHistory()
+        history.append(price_change)
+        # Cached curve data would still carry the previous ticks
+        DataCollector.get_curve_data.invalidate(self, token_mint)
     
+    @async_ttl_cache(maxsize=FETCH_CACHE_SIZE, ttl_seconds=FETCH_CACHE_TTL_SECONDS)
     async def get_curve_data(self, token_mint: Pubkey) -> Dict[str, Any]:
         """
         Get bonding curve data for a token
         
+        Repeated calls within FETCH_CACHE_TTL_SECONDS return the same
+        dictionary; recording a price tick drops the mint's cached entry.
+        
         Args:
             token_mint: Token mint address
             
@@ -57,7 +158,7 @@ class DataCollector:
         
         try:
             # In real implementation, this would:
-            # 1. Fetch token account data
+            # 1. Fetch token account data (via get_account_info, batched)
             # 2. Parse bonding curve account
             # 3. Calculate metrics
             
@@ -65,34 +166,46 @@ class DataCollector:
             logger.debug(f"Fetching curve data for {token_mint}")
             
             # TODO: Implement actual on-chain data fetching
-            return {
+            curve_data = {
                 "token_mint": str(token_mint),
                 "current_price": 0.0,
                 "slope": 0.0,
                 "liquidity": 0.0,
                 "total_supply": 0.0,
                 "market_cap": 0.0,
-                "timestamp": datetime.utcnow().timestamp()
+                "timestamp": time.time()
             }
             
+            # A snapshot, not a view: the result is cached and analyzed in a
+            # worker thread while later ticks overwrite the ring buffer
+            history = self.price_histories.get(token_mint)
+            if history is not None:
+                curve_data["price_changes"] = history.view().copy()
+            
+            return curve_data
+            
         except Exception as e:
             logger.error(f"Error fetching curve data: {e}")
             raise
     
+    @async_ttl_cache(maxsize=FETCH_CACHE_SIZE, ttl_seconds=FETCH_CACHE_TTL_SECONDS)
     async def get_recent_transactions(
         self,
         token_mint: Pubkey,
         time_window_minutes: int = 30
-    ) -> List[Dict[str, Any]]:
+    ) -> TxBatch:
         """
         Get recent transactions for a token
         
+        Repeated calls within FETCH_CACHE_TTL_SECONDS return the same batch.
+        
         Args:
             token_mint: Token mint address
             time_window_minutes: Time window in minutes
             
         Returns:
-            List of transaction data
+            Columnar batch of transactions, oldest first (pattern and risk
+            detectors rely on this ordering to skip re-sorting)
         """
         await self.connect()
         
@@ -100,7 +213,7 @@ class DataCollector:
             # In real implementation, this would:
             # 1. Query transaction history
             # 2. Filter by token
-            # 3. Parse transaction data
+            # 3. Parse transaction data straight into TxBatch columns
             
             logger.debug(
                 f"Fetching transactions for {token_mint} "
@@ -109,12 +222,44 @@ class DataCollector:
             
             # TODO: Implement actual transaction fetching
             # Placeholder
-            return []
+            return TxBatch.empty()
             
         except Exception as e:
             logger.error(f"Error fetching transactions: {e}")
             raise
     
+    async def get_recent_transactions_batch(
+        self,
+        token_mints: Iterable[Pubkey],
+        time_window_minutes: int = 30,
+        max_concurrency: int = 32
+    ) -> Dict[Pubkey, TxBatch]:
+        """
+        Get recent transactions for many tokens
+        
+        Args:
+            token_mints: Token mint addresses (duplicates are fetched once)
+            time_window_minutes: Time window in minutes
+            max_concurrency: Maximum fetches in flight at once
+            
+        Returns:
+            Dictionary mapping each token mint to its transactions, oldest first
+        """
+        await self.connect()
+        
+        # In real implementation, the getSignaturesForAddress queries would be
+        # sent as one JSON-RPC batch request instead of one request per mint
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch_one(token_mint: Pubkey) -> TxBatch:
+            async with semaphore:
+                return await self.get_recent_transactions(token_mint, time_window_minutes)
+        
+        token_mints = list(dict.fromkeys(token_mints))
+        results = await asyncio.gather(*(fetch_one(token_mint) for token_mint in token_mints))
+        
+        return dict(zip(token_mints, results))
+    
     async def get_token_holders(
         self,
         token_mint: Pubkey,
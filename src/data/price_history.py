@@ -0,0 +1,74 @@
+"""
+Price History
+
+Fixed-size NumPy ring buffer for per-token price changes.
+"""
+
+from typing import Iterable, Optional
+import numpy as np
+
+DEFAULT_CAPACITY = 8192
+
+
+class PriceHistory:
+    """
+    Ring buffer of price changes backed by one contiguous float64 array
+
+    Every value is written twice (at i and i + capacity), so the most recent
+    window is always a contiguous slice and can be read without copying.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Initialize price history
+
+        Args:
+            capacity: Maximum number of price changes kept
+        """
+        self.capacity = capacity
+        self._buffer = np.zeros(2 * capacity, dtype=np.float64)
+        self._head = 0  # Next write position in [0, capacity)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, price_change: float):
+        """
+        Record a price change, overwriting the oldest once full
+
+        Args:
+            price_change: Relative price change
+        """
+        self._buffer[self._head] = price_change
+        self._buffer[self._head + self.capacity] = price_change
+        self._head = (self._head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def extend(self, price_changes: Iterable[float]):
+        """
+        Record several price changes in order
+
+        Args:
+            price_changes: Relative price changes, oldest first
+        """
+        for price_change in price_changes:
+            self.append(price_change)
+
+    def view(self, n: Optional[int] = None) -> np.ndarray:
+        """
+        Get the most recent price changes, oldest first
+
+        The result is a view into the buffer: later appends overwrite it,
+        so copy it if it has to outlive the current computation.
+
+        Args:
+            n: Number of price changes (default: all recorded)
+
+        Returns:
+            float64 array view
+        """
+        n = self._size if n is None else max(0, min(n, self._size))
+        end = self._head + self.capacity
+        return self._buffer[end - n:end]
@@ -0,0 +1,130 @@
+"""
+Transaction Batches
+
+Columnar (structure-of-arrays) storage for recent token transactions.
+"""
+
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, Sequence, Union, overload
+import numpy as np
+
+# Transaction dict field -> TxBatch column
+_NUMERIC_COLUMNS = {
+    "timestamp": "timestamps",
+    "amount": "amounts",
+    "price": "prices",
+}
+
+# C-level field getters for list-of-dicts input
+_GETTERS = {key: itemgetter(key) for key in _NUMERIC_COLUMNS}
+
+
+@dataclass(slots=True)
+class TxBatch:
+    """
+    Transactions stored as parallel columns, oldest first
+
+    Numeric consumers read the float64 columns directly. Iteration,
+    indexing and len() keep the old list-of-dicts contract: an integer index
+    gives a transaction dict and a slice gives a smaller TxBatch.
+
+    Attributes:
+        timestamps: Transaction times in epoch seconds (float64)
+        amounts: Transaction amounts (float64)
+        prices: Execution prices, 0 where unknown (float64)
+        wallets: Signer wallet addresses (object)
+    """
+    timestamps: np.ndarray
+    amounts: np.ndarray
+    prices: np.ndarray
+    wallets: np.ndarray
+
+    @classmethod
+    def empty(cls) -> "TxBatch":
+        """Create a batch with no transactions"""
+        return cls.from_records(())
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "TxBatch":
+        """
+        Build a batch from transaction dicts
+
+        Args:
+            records: Transactions with timestamp, amount, price and wallet
+                fields (missing numbers count as 0)
+
+        Returns:
+            TxBatch instance
+        """
+        records = list(records)
+        count = len(records)
+        return cls(
+            timestamps=np.fromiter((r.get("timestamp", 0) for r in records), np.float64, count),
+            amounts=np.fromiter((r.get("amount", 0) for r in records), np.float64, count),
+            prices=np.fromiter((r.get("price", 0) for r in records), np.float64, count),
+            wallets=np.array([r.get("wallet", "unknown") for r in records], dtype=object),
+        )
+
+    def __len__(self) -> int:
+        return self.timestamps.size
+
+    @overload
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "TxBatch":
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, Any], "TxBatch"]:
+        if isinstance(index, slice):
+            return TxBatch(
+                timestamps=self.timestamps[index],
+                amounts=self.amounts[index],
+                prices=self.prices[index],
+                wallets=self.wallets[index],
+            )
+        return {
+            "timestamp": float(self.timestamps[index]),
+            "amount": float(self.amounts[index]),
+            "price": float(self.prices[index]),
+            "wallet": self.wallets[index],
+        }
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for timestamp, amount, price, wallet in zip(
+            self.timestamps.tolist(),
+            self.amounts.tolist(),
+            self.prices.tolist(),
+            self.wallets.tolist(),
+        ):
+            yield {"timestamp": timestamp, "amount": amount, "price": price, "wallet": wallet}
+
+
+Transactions = Union[TxBatch, Sequence[Dict[str, Any]]]
+
+
+def transaction_column(transactions: Transactions, key: str) -> np.ndarray:
+    """
+    Get one numeric transaction field as a float64 array
+
+    A TxBatch column is returned as-is (no copy); a list of dicts is
+    converted with missing values as 0 (the itemgetter fast path only
+    falls back to dict.get() when a transaction lacks the field).
+
+    Args:
+        transactions: TxBatch or list of transaction dicts
+        key: Field name ("timestamp", "amount" or "price")
+
+    Returns:
+        float64 array aligned with transactions
+    """
+    if isinstance(transactions, TxBatch):
+        column: np.ndarray = getattr(transactions, _NUMERIC_COLUMNS[key])
+        return column
+    count = len(transactions)
+    try:
+        return np.fromiter(map(_GETTERS[key], transactions), dtype=np.float64, count=count)
+    except KeyError:
+        return np.fromiter((tx.get(key, 0) for tx in transactions), dtype=np.float64, count=count)
@@ -0,0 +1,208 @@
+"""
+Cache utilities
+
+Bounded in-memory caches for long-running processes.
+"""
+
+import asyncio
+import functools
+import inspect
+import time
+import types
+import weakref
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import (
+    Any, Callable, Coroutine, Dict, Generic, Hashable, Iterator, Optional, Tuple, TypeVar,
+    overload
+)
+
+
+class TTLCache(MutableMapping):
+    """
+    LRU cache with a size cap and per-entry time-to-live
+
+    Behaves like a dict: expired entries are dropped on access and the
+    least recently used entry is evicted once maxsize is exceeded.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize cache
+
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Entry time-to-live in seconds
+            timer: Clock used for expiry (monotonic by default)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        # key -> (expires_at, value), ordered from least to most recently used
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def __getitem__(self, key: Hashable) -> Any:
+        expires_at, value = self._data[key]
+        if expires_at <= self._timer():
+            del self._data[key]
+            raise KeyError(key)
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (self._timer() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __delitem__(self, key: Hashable) -> None:
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        self.expire()
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        self.expire()
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}"
+            f"(maxsize={self.maxsize}, ttl={self.ttl}, size={len(self)})"
+        )
+
+    def expire(self) -> None:
+        """Drop all expired entries"""
+        now = self._timer()
+        expired = [key for key, (expires_at, _) in self._data.items() if expires_at <= now]
+        for key in expired:
+            del self._data[key]
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._data.clear()
+
+
+R = TypeVar("R")
+
+
+class _TTLCachedMethod(Generic[R]):
+    """Async method wrapper returned by async_ttl_cache"""
+
+    def __init__(
+        self,
+        method: Callable[..., Coroutine[Any, Any, R]],
+        maxsize: int,
+        ttl_seconds: float
+    ):
+        functools.update_wrapper(self, method)
+        self._method = method
+        self._signature = inspect.signature(method)
+        self._maxsize = maxsize
+        self._ttl_seconds = ttl_seconds
+        self._caches: "weakref.WeakKeyDictionary[Any, TTLCache]" = weakref.WeakKeyDictionary()
+
+    @overload
+    def __get__(self, instance: None, owner: Optional[type] = None) -> "_TTLCachedMethod[R]":
+        ...
+
+    @overload
+    def __get__(
+        self,
+        instance: object,
+        owner: Optional[type] = None
+    ) -> Callable[..., Coroutine[Any, Any, R]]:
+        ...
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
+
+    async def __call__(self, instance: Any, *args: Any, **kwargs: Any) -> R:
+        key = self._key(instance, args, kwargs)
+        entries = self.cache(instance)
+        loop = asyncio.get_running_loop()
+        task: Optional["asyncio.Task[R]"] = entries.get(key)
+        # A task from another event loop (an earlier asyncio.run) can't be awaited here
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(self._method(instance, *args, **kwargs))
+            task.add_done_callback(functools.partial(_forget_failure, entries, key))
+            entries[key] = task
+        return await asyncio.shield(task)
+
+    def _key(self, instance: Any, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+        """Call arguments bound to parameter names, with defaults filled in"""
+        bound = self._signature.bind(instance, *args, **kwargs)
+        bound.apply_defaults()
+        return tuple(bound.arguments.values())[1:]
+
+    def cache(self, instance: Any) -> TTLCache:
+        """
+        Get an instance's cache of in-flight and finished calls
+
+        Args:
+            instance: Object the method is bound to
+
+        Returns:
+            TTLCache keyed by normalized call arguments
+        """
+        entries = self._caches.get(instance)
+        if entries is None:
+            entries = TTLCache(maxsize=self._maxsize, ttl=self._ttl_seconds)
+            self._caches[instance] = entries
+        return entries
+
+    def invalidate(self, instance: Any, *args: Any, **kwargs: Any) -> None:
+        """
+        Drop the cached result of one call (e.g. after a local update)
+
+        Args:
+            instance: Object the method is bound to
+            *args: Call arguments, in any positional/keyword form
+            **kwargs: Call keyword arguments
+        """
+        self.cache(instance).pop(self._key(instance, args, kwargs), None)
+
+
+def _forget_failure(entries: TTLCache, key: Hashable, task: "asyncio.Task[Any]") -> None:
+    """Drop a failed or cancelled call so the next caller retries"""
+    failed = task.cancelled() or task.exception() is not None
+    if failed and entries.get(key) is task:
+        del entries[key]
+
+
+def async_ttl_cache(
+    maxsize: int = 1024,
+    ttl_seconds: float = 2.0
+) -> Callable[[Callable[..., Coroutine[Any, Any, R]]], _TTLCachedMethod[R]]:
+    """
+    Cache an async method's results per instance for a short time
+
+    The key is the call's arguments bound to parameter names (defaults
+    filled in), so positional and keyword calls share an entry. Concurrent
+    calls with the same key on the same event loop share one in-flight
+    call, and a hit returns the same result object (it is not copied).
+    Failed calls are not cached.
+
+    The wrapped method gains cache(instance), which returns that
+    instance's TTLCache, and invalidate(instance, *args, **kwargs), which
+    drops one call's entry (e.g. after local updates).
+
+    Args:
+        maxsize: Maximum cached entries per instance
+        ttl_seconds: Entry time-to-live in seconds
+
+    Returns:
+        Method decorator
+    """
+    def decorator(method: Callable[..., Coroutine[Any, Any, R]]) -> _TTLCachedMethod[R]:
+        return _TTLCachedMethod(method, maxsize, ttl_seconds)
+
+    return decorator
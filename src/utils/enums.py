@@ -0,0 +1,23 @@
+"""
+Enum utilities
+
+StrEnum for Python 3.10, where enum.StrEnum is not available.
+"""
+
+import sys
+from enum import Enum
+
+# A version check (not try/except ImportError) so type checkers pick the branch
+if sys.version_info >= (3, 11):
+    from enum import StrEnum
+else:
+    class StrEnum(str, Enum):
+        """Enum whose members are strings and format as their value"""
+
+        def __str__(self) -> str:
+            return str.__str__(self)
+
+        def __format__(self, format_spec: str) -> str:
+            return str.__format__(self, format_spec)
+
+__all__ = ["StrEnum"]
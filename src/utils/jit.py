@@ -0,0 +1,51 @@
+"""
+JIT utilities
+
+Optional Numba support for numeric kernels.
+"""
+
+from typing import Any, Callable, TypeVar, overload
+
+try:
+    import numba
+except ImportError:  # numba is an optional dependency
+    NUMBA_AVAILABLE = False
+else:
+    NUMBA_AVAILABLE = True
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@overload
+def njit(func: F, /) -> F:
+    ...
+
+
+@overload
+def njit(*args: Any, **kwargs: Any) -> Callable[[F], F]:
+    ...
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """
+    Compile a function with ``numba.njit`` if numba is installed
+
+    Without numba the function is returned unchanged, so kernels still run
+    as plain Python. Callers with a faster NumPy fallback should check
+    NUMBA_AVAILABLE instead of relying on this.
+
+    Args:
+        *args: Positional arguments for numba.njit (or the function itself)
+        **kwargs: Keyword arguments for numba.njit
+
+    Returns:
+        Compiled function (typed as the original), or decorator when used
+        with arguments
+    """
+    if NUMBA_AVAILABLE:
+        return numba.njit(*args, **kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    return lambda func: func
@@ -5,6 +5,10 @@ Helper functions for calculating various metrics.
 """
 
 from typing import List
+import numpy as np
+
+# Below this many values NumPy's per-call overhead outweighs its faster loop
+NUMPY_MIN_VALUES = 32
 
 
 def calculate_average(values: List[float]) -> float:
@@ -17,9 +21,11 @@ def calculate_average(values: List[float]) -> float:
     Returns:
         Average value
     """
-    if not values:
+    if len(values) == 0:
         return 0.0
-    return sum(values) / len(values)
+    if len(values) < NUMPY_MIN_VALUES:
+        return sum(values) / len(values)
+    return float(np.asarray(values, dtype=np.float64).mean())
 
 
 def calculate_standard_deviation(values: List[float]) -> float:
@@ -32,12 +38,16 @@ def calculate_standard_deviation(values: List[float]) -> float:
     Returns:
         Standard deviation
     """
-    if not values or len(values) < 2:
+    if len(values) < 2:
         return 0.0
     
-    mean = calculate_average(values)
-    variance = sum((x - mean) ** 2 for x in values) / len(values)
-    return variance ** 0.5
+    if len(values) < NUMPY_MIN_VALUES:
+        mean = sum(values) / len(values)
+        variance = sum((x - mean) ** 2 for x in values) / len(values)
+        return variance ** 0.5
+    
+    # Population standard deviation in one vectorized reduction
+    return float(np.asarray(values, dtype=np.float64).std())
 
 
 def normalize(value: float, min_val: float, max_val: float) -> float:
@@ -0,0 +1,35 @@
+"""
+Timestamp utilities
+
+Lazy ISO-8601 formatting for epoch timestamps.
+"""
+
+import time
+from typing import Tuple
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS" prefix) of the last call
+_last_prefix: Tuple[int, str] = (-1, "")
+
+
+def format_iso_timestamp(timestamp_ms: int) -> str:
+    """
+    Format an epoch timestamp in milliseconds as a UTC ISO-8601 string
+
+    The formatted date/time prefix is cached per second, so consecutive
+    calls within the same second only append the milliseconds.
+
+    Args:
+        timestamp_ms: Milliseconds since the epoch
+
+    Returns:
+        ISO timestamp (e.g. "2024-01-01T00:00:00.000+00:00")
+    """
+    global _last_prefix
+
+    second, milliseconds = divmod(int(timestamp_ms), 1000)
+    cached_second, prefix = _last_prefix
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _last_prefix = (second, prefix)
+
+    return f"{prefix}.{milliseconds:03d}+00:00"
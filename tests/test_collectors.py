@@ -0,0 +1,247 @@
+"""
+Tests for data collection
+"""
+
+import asyncio
+import pytest
+from solders.pubkey import Pubkey
+from solana.exceptions import SolanaRpcException
+from src.data.batching import BatchingRpcClient
+from src.data.collectors import DataCollector
+from src.data.price_history import PriceHistory
+from src.data.transactions import TxBatch, transaction_column
+
+
+class FakeResponse:
+    def __init__(self, value):
+        self.value = value
+
+
+class FakeClient:
+    """Records getMultipleAccounts calls and echoes pubkeys back as accounts"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    async def get_multiple_accounts(self, pubkeys, commitment=None):
+        self.calls.append(list(pubkeys))
+        return FakeResponse([f"account-{pubkey}" for pubkey in pubkeys])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_batch():
+    """Test concurrent get_account calls are sent as one request"""
+    client = FakeClient()
+    batcher = BatchingRpcClient(client)
+    keys = [Pubkey.new_unique() for _ in range(3)]
+    
+    accounts = await asyncio.gather(*(batcher.get_account(k) for k in keys + keys[:1]))
+    
+    assert len(client.calls) == 1
+    assert client.calls[0] == keys  # Duplicate lookup deduplicated
+    assert accounts == [f"account-{k}" for k in keys + keys[:1]]
+
+
+@pytest.mark.asyncio
+async def test_batches_split_at_max_size():
+    """Test lookups beyond max_batch_size go out in separate requests"""
+    client = FakeClient()
+    batcher = BatchingRpcClient(client, max_batch_size=2)
+    keys = [Pubkey.new_unique() for _ in range(5)]
+    
+    await asyncio.gather(*(batcher.get_account(k) for k in keys))
+    
+    assert [len(call) for call in client.calls] == [2, 2, 1]
+
+
+def test_price_history_wraps():
+    """Test price history keeps the latest values in order once full"""
+    history = PriceHistory(capacity=4)
+    history.extend([1.0, 2.0])
+    assert history.view().tolist() == [1.0, 2.0]
+    
+    history.extend([3.0, 4.0, 5.0, 6.0])
+    assert len(history) == 4
+    assert history.view().tolist() == [3.0, 4.0, 5.0, 6.0]
+    assert history.view(2).tolist() == [5.0, 6.0]
+
+
+@pytest.mark.asyncio
+async def test_curve_data_includes_price_history():
+    """Test recorded price ticks are returned with curve data"""
+    collector = DataCollector()
+    token_mint = Pubkey.new_unique()
+    
+    collector.record_price_change(token_mint, 0.01)
+    collector.record_price_change(token_mint, -0.02)
+    curve_data = await collector.get_curve_data(token_mint)
+    await collector.disconnect()
+    
+    assert curve_data["price_changes"].tolist() == [0.01, -0.02]
+
+
+def test_tx_batch_round_trip():
+    """Test a transaction batch keeps the list-of-dicts view"""
+    records = [
+        {"timestamp": 10.0, "amount": 2.0, "price": 0.5, "wallet": "a"},
+        {"timestamp": 20.0, "amount": 3.0, "wallet": "b"},
+    ]
+    
+    batch = TxBatch.from_records(records)
+    
+    assert len(batch) == 2
+    assert list(batch) == [records[0], {**records[1], "price": 0.0}]
+    assert batch[1]["wallet"] == "b"
+    assert len(batch[1:]) == 1
+    assert transaction_column(batch, "amount") is batch.amounts
+    assert transaction_column(records, "amount").tolist() == [2.0, 3.0]
+    assert transaction_column(records, "price").tolist() == [0.5, 0.0]  # Missing = 0
+    assert len(TxBatch.empty()) == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_connects_share_one_client():
+    """Test concurrent connects create a single client, closed on exit"""
+    async with DataCollector() as collector:
+        await asyncio.gather(*(collector.connect() for _ in range(5)))
+        client = collector.client
+        
+        await collector.get_recent_transactions(Pubkey.new_unique())
+        
+        assert client is not None
+        assert collector.client is client
+    
+    assert collector.client is None
+    assert collector.batch_client is None
+
+
+@pytest.mark.asyncio
+async def test_connect_during_disconnect_gets_new_client():
+    """Test a connect racing a disconnect never gets the client being closed"""
+    collector = DataCollector()
+    old_batch_client = await collector.connect()
+    old_client = collector.client
+    
+    closing = asyncio.Event()
+    release = asyncio.Event()
+    close_client = old_client.close
+    
+    async def slow_close():
+        closing.set()
+        await release.wait()
+        await close_client()
+    
+    old_client.close = slow_close
+    disconnect = asyncio.create_task(collector.disconnect())
+    await closing.wait()
+    
+    connect = asyncio.create_task(collector.connect())
+    await asyncio.sleep(0)
+    release.set()
+    await disconnect
+    new_batch_client = await connect
+    
+    assert new_batch_client is not old_batch_client
+    assert collector.batch_client is new_batch_client
+    assert collector.client is not old_client
+    
+    await collector.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_fetches_are_cached_briefly():
+    """Test repeated fetches share one result until a local update"""
+    collector = DataCollector()
+    token_mint = Pubkey.new_unique()
+    
+    first, second = await asyncio.gather(
+        collector.get_recent_transactions(token_mint, 10),
+        collector.get_recent_transactions(token_mint, 10)
+    )
+    curve_data = await collector.get_curve_data(token_mint)
+    
+    assert first is second
+    assert await collector.get_recent_transactions(token_mint, 10) is first
+    assert await collector.get_recent_transactions(token_mint, 5) is not first
+    assert await collector.get_curve_data(token_mint) is curve_data
+    
+    collector.record_price_change(token_mint, 0.01)
+    refreshed = await collector.get_curve_data(token_mint)
+    await collector.disconnect()
+    
+    assert refreshed is not curve_data
+    assert refreshed["price_changes"].tolist() == [0.01]
+
+
+@pytest.mark.asyncio
+async def test_curve_data_snapshots_price_history():
+    """Test returned price changes are not overwritten by later ticks"""
+    collector = DataCollector()
+    token_mint = Pubkey.new_unique()
+    collector.price_histories[token_mint] = PriceHistory(capacity=2)
+    collector.record_price_change(token_mint, 0.01)
+    collector.record_price_change(token_mint, 0.02)
+    
+    curve_data = await collector.get_curve_data(token_mint)
+    collector.record_price_change(token_mint, 0.03)  # Overwrites the oldest slot
+    
+    assert curve_data["price_changes"].tolist() == [0.01, 0.02]
+
+
+def test_price_histories_evict_least_recent_mint():
+    """Test price histories are capped, dropping the least recently ticked mint"""
+    collector = DataCollector()
+    collector.price_histories.maxsize = 2
+    first, second, third = (Pubkey.new_unique() for _ in range(3))
+    
+    collector.record_price_change(first, 0.01)
+    collector.record_price_change(second, 0.02)
+    collector.record_price_change(first, 0.03)
+    collector.record_price_change(third, 0.04)
+    
+    assert set(collector.price_histories) == {first, third}
+    assert collector.price_histories[first].view().tolist() == [0.01, 0.03]
+
+
+@pytest.mark.asyncio
+async def test_keyword_fetches_share_cache_entries():
+    """Test keyword calls hit (and are invalidated with) the positional entry"""
+    collector = DataCollector()
+    token_mint = Pubkey.new_unique()
+    
+    batch = await collector.get_recent_transactions(token_mint)
+    curve_data = await collector.get_curve_data(token_mint=token_mint)
+    
+    assert await collector.get_recent_transactions(token_mint, time_window_minutes=30) is batch
+    assert await collector.get_curve_data(token_mint) is curve_data
+    
+    collector.record_price_change(token_mint, 0.01)
+    refreshed = await collector.get_curve_data(token_mint=token_mint)
+    
+    assert refreshed is not curve_data
+    assert refreshed["price_changes"].tolist() == [0.01]
+
+
+def test_cached_fetches_survive_a_new_event_loop():
+    """Test a collector reused across asyncio.run calls fetches on the new loop"""
+    collector = DataCollector()
+    token_mint = Pubkey.new_unique()
+    
+    async def fetch():
+        return await collector.get_curve_data(token_mint)
+    
+    first = asyncio.run(fetch())
+    second = asyncio.run(fetch())
+    
+    assert second is not first
+    assert second["token_mint"] == first["token_mint"]
+
+
+@pytest.mark.asyncio
+async def test_failed_rpc_call_raises_solana_exception():
+    """Test transport failures surface as the client's documented exception"""
+    collector = DataCollector(rpc_url="http://127.0.0.1:9")  # Nothing listens here
+    
+    with pytest.raises(SolanaRpcException):
+        await collector.get_account_info(Pubkey.new_unique())
+    await collector.disconnect()
@@ -4,7 +4,7 @@ Tests for curve analyzer
 
 import pytest
 from solders.pubkey import Pubkey
-from src.curve_intelligence.curve_analyzer import CurveAnalyzer
+from src.curve_intelligence.curve_analyzer import CurveAnalyzer, CurveAnalysis, _decode_mint
 
 
 @pytest.mark.asyncio
@@ -30,10 +30,37 @@ async def test_analyze_curve():
     
     analysis = await analyzer.analyze_curve(token_mint, curve_data)
     
+    assert isinstance(analysis, CurveAnalysis)
+    assert analysis.token_mint == str(token_mint)
+    assert 0.0 <= analysis.slope_position <= 1.0
+    assert 0.0 <= analysis.liquidity_depth <= 1.0
+    assert analysis.volatility == 0.0
+    
+    # Mapping-style access still works for dict-based callers
     assert analysis["token_mint"] == str(token_mint)
     assert "slope_position" in analysis
-    assert "liquidity_depth" in analysis
-    assert "volatility" in analysis
+    assert analysis.get("price_change_24h", 0) == 0
+    assert analysis.get("keys") is None
+    
+    as_dict = dict(analysis)
+    assert as_dict["volatility"] == analysis.volatility
+    assert list(analysis) == list(as_dict) == list(analysis.keys())
+    assert len(analysis) == len(as_dict) == 10
+    assert {**analysis}["token_mint"] == str(token_mint)
+
+
+@pytest.mark.asyncio
+async def test_analyze_curve_string_mint():
+    """Test curve analysis with a mint passed as a string"""
+    analyzer = CurveAnalyzer()
+    token_mint = "11111111111111111111111111111111"
+    
+    analysis = await analyzer.analyze_curve(token_mint, {"current_price": 0.001})
+    
+    assert analysis.token_mint == token_mint
+    assert analyzer.get_cached_analysis(Pubkey.from_string(token_mint)) is analysis
+    assert analyzer.get_cached_analysis(token_mint) is analysis
+    assert _decode_mint(token_mint) is _decode_mint(token_mint)
 
 
 def test_calculate_slope_position():
@@ -61,6 +88,52 @@ def test_get_cached_analysis():
     assert analyzer.get_cached_analysis(token_mint) is None
     
     # Add to cache manually
-    analyzer.cache[str(token_mint)] = {"test": "data"}
+    analyzer.cache[bytes(token_mint)] = {"test": "data"}
     assert analyzer.get_cached_analysis(token_mint) is not None
 
+
+def test_calculate_volatility():
+    """Test volatility calculation"""
+    analyzer = CurveAnalyzer()
+    
+    assert analyzer._calculate_volatility({}) == 0.0
+    assert analyzer._calculate_volatility({"price_changes": [0.05]}) == 0.0
+    
+    # Population std of [0.0, 0.02] is 0.01 -> 0.1 after normalization
+    volatility = analyzer._calculate_volatility({"price_changes": [0.0, 0.02]})
+    assert volatility == pytest.approx(0.1)
+    
+    # Capped at 1.0
+    assert analyzer._calculate_volatility({"price_changes": [-1.0, 1.0]}) == 1.0
+
+
+def test_cache_is_bounded():
+    """Test analysis cache evicts least recently used entries"""
+    analyzer = CurveAnalyzer()
+    analyzer.cache.maxsize = 2
+    
+    analyzer.cache["a"] = {"test": "a"}
+    analyzer.cache["b"] = {"test": "b"}
+    assert analyzer.cache.get("a") is not None  # "a" is now most recently used
+    analyzer.cache["c"] = {"test": "c"}
+    
+    assert len(analyzer.cache) == 2
+    assert "b" not in analyzer.cache
+    assert "a" in analyzer.cache and "c" in analyzer.cache
+
+
+@pytest.mark.asyncio
+async def test_analyze_curve_long_price_history():
+    """Test analysis of price histories large enough to run off the event loop"""
+    analyzer = CurveAnalyzer()
+    token_mint = Pubkey.from_string("11111111111111111111111111111111")
+    
+    curve_data = {
+        "current_price": 0.001,
+        "market_cap": 1000.0,
+        "price_changes": [0.0, 0.02] * 4096
+    }
+    
+    analysis = await analyzer.analyze_curve(token_mint, curve_data)
+    
+    assert analysis.volatility == pytest.approx(0.1)
@@ -0,0 +1,199 @@
+"""
+Tests for curve intelligence layer
+"""
+
+import asyncio
+import pytest
+from solders.pubkey import Pubkey
+from src.curve_intelligence import intelligence_layer
+from src.curve_intelligence.intelligence_layer import CurveIntelligenceLayer
+
+
+@pytest.mark.asyncio
+async def test_analyze_token_single_flight(monkeypatch):
+    """Test concurrent analyses of the same mint share one computation"""
+    layer = CurveIntelligenceLayer()
+    token_mint = Pubkey.from_string("11111111111111111111111111111111")
+    calls = []
+    
+    async def fake_analyze(self, mint):
+        calls.append(mint)
+        await asyncio.sleep(0.01)
+        return {"token_mint": str(mint)}
+    
+    monkeypatch.setattr(CurveIntelligenceLayer, "_analyze_token", fake_analyze)
+    
+    results = await asyncio.gather(*(layer.analyze_token(token_mint) for _ in range(5)))
+    
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert not layer._inflight
+    
+    # Once finished, the next call computes afresh
+    await layer.analyze_token(token_mint)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_analyze_token_single_flight_error(monkeypatch):
+    """Test an error is raised to every concurrent caller and not kept"""
+    layer = CurveIntelligenceLayer()
+    token_mint = Pubkey.from_string("11111111111111111111111111111111")
+    
+    async def failing_analyze(self, mint):
+        await asyncio.sleep(0.01)
+        raise ValueError("No curve data available")
+    
+    monkeypatch.setattr(CurveIntelligenceLayer, "_analyze_token", failing_analyze)
+    
+    results = await asyncio.gather(
+        *(layer.analyze_token(token_mint) for _ in range(3)),
+        return_exceptions=True
+    )
+    
+    assert all(isinstance(result, ValueError) for result in results)
+    assert not layer._inflight
+
+
+@pytest.mark.asyncio
+async def test_analyze_token_leader_cancelled(monkeypatch):
+    """Test cancelling the first caller does not cancel callers sharing its analysis"""
+    layer = CurveIntelligenceLayer()
+    token_mint = Pubkey.from_string("11111111111111111111111111111111")
+    calls = []
+    
+    async def fake_analyze(self, mint):
+        calls.append(mint)
+        await asyncio.sleep(0.01)
+        return {"token_mint": str(mint)}
+    
+    monkeypatch.setattr(CurveIntelligenceLayer, "_analyze_token", fake_analyze)
+    
+    leader = asyncio.ensure_future(layer.analyze_token(token_mint))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(layer.analyze_token(token_mint))
+    await asyncio.sleep(0)
+    leader.cancel()
+    
+    assert await follower == {"token_mint": str(token_mint)}
+    assert leader.cancelled()
+    assert len(calls) == 1
+    assert not layer._inflight
+
+
+@pytest.mark.asyncio
+async def test_get_curve_reuses_recent_analysis():
+    """Test back-to-back and concurrent curve lookups share one analysis"""
+    layer = CurveIntelligenceLayer()
+    token_mint = Pubkey.from_string("11111111111111111111111111111111")
+    calls = []
+    
+    async def fake_analyze_curve(mint, curve_data=None):
+        calls.append(mint)
+        await asyncio.sleep(0.01)
+        return {"token_mint": str(mint)}
+    
+    layer.curve_analyzer.analyze_curve = fake_analyze_curve
+    
+    first, second = await asyncio.gather(layer._get_curve(token_mint), layer._get_curve(token_mint))
+    third = await layer._get_curve(token_mint)
+    
+    assert len(calls) == 1
+    assert first is second is third
+    
+    # Expired entries are recomputed
+    layer._curve_cache.clear()
+    await layer._get_curve(token_mint)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_curve_leader_cancelled():
+    """Test a cancelled curve lookup still serves and caches the shared analysis"""
+    layer = CurveIntelligenceLayer()
+    token_mint = Pubkey.from_string("11111111111111111111111111111111")
+    calls = []
+    
+    async def fake_analyze_curve(mint, curve_data=None):
+        calls.append(mint)
+        await asyncio.sleep(0.01)
+        return {"token_mint": str(mint)}
+    
+    layer.curve_analyzer.analyze_curve = fake_analyze_curve
+    
+    leader = asyncio.ensure_future(layer._get_curve(token_mint))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(layer._get_curve(token_mint))
+    await asyncio.sleep(0)
+    leader.cancel()
+    
+    analysis = await follower
+    
+    assert analysis == {"token_mint": str(token_mint)}
+    assert await layer._get_curve(token_mint) is analysis  # Cached despite the cancel
+    assert len(calls) == 1
+    assert not layer._curve_inflight
+
+
+def test_components_created_on_first_use():
+    """Test components are built lazily and shared"""
+    layer = CurveIntelligenceLayer()
+    
+    assert layer._curve_analyzer is None
+    assert layer._window_optimizer is None
+    
+    optimizer = layer.window_optimizer
+    
+    assert optimizer.curve_analyzer is layer.curve_analyzer
+    assert optimizer.risk_detector is layer.risk_detector
+    assert layer._pattern_recognizer is None
+
+
+class FakeRecommendation:
+    recommended_size = 1.0
+    entry_price_target = 0.001
+    execution_urgency = "low"
+    optimal_timing = "now"
+    confidence_score = 0.9
+
+
+class FakeArciumClient:
+    """Arcium bridge client stub counting instances and closes"""
+    instances = 0
+    closes = 0
+    
+    def __init__(self):
+        FakeArciumClient.instances += 1
+    
+    async def get_curve_evaluation(self, **kwargs):
+        return FakeRecommendation()
+    
+    async def close(self):
+        FakeArciumClient.closes += 1
+
+
+@pytest.mark.asyncio
+async def test_confidential_evaluation_reuses_client(monkeypatch):
+    """Test one Arcium client serves every evaluation and is closed with the layer"""
+    arcium = {
+        "client": FakeArciumClient,
+        "models": {name: dict for name in ("SizingPreferences", "UserConstraints", "CurveMetrics")}
+    }
+    monkeypatch.setattr(intelligence_layer, "_load_arcium", lambda: arcium)
+    layer = CurveIntelligenceLayer(use_confidential_intel=True)
+    token_mint = Pubkey.from_string("11111111111111111111111111111111")
+    
+    async def fake_analyze_curve(mint, curve_data=None):
+        return {"current_price": 1.0, "liquidity_depth": 0.5}
+    
+    layer.curve_analyzer.analyze_curve = fake_analyze_curve
+    
+    for _ in range(3):
+        result = await layer.get_confidential_curve_evaluation(token_mint, {}, {})
+        assert result["confidence_score"] == 0.9
+    
+    assert FakeArciumClient.instances == 1
+    assert FakeArciumClient.closes == 0
+    
+    await layer.close()
+    assert FakeArciumClient.closes == 1
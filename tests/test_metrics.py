@@ -0,0 +1,30 @@
+"""
+Tests for metrics utilities
+"""
+
+import numpy as np
+import pytest
+from src.utils.metrics import (
+    NUMPY_MIN_VALUES,
+    calculate_average,
+    calculate_standard_deviation,
+)
+
+
+def test_small_and_large_inputs_agree():
+    """Test the pure-Python and NumPy paths give the same statistics"""
+    small = [1.0, 2.0, 4.0, 8.0]
+    large = small * NUMPY_MIN_VALUES
+    
+    assert calculate_average(small) == pytest.approx(3.75)
+    assert calculate_average(large) == pytest.approx(3.75)
+    assert calculate_standard_deviation(small) == pytest.approx(np.std(small))
+    assert calculate_standard_deviation(large) == pytest.approx(np.std(small))
+
+
+def test_empty_inputs():
+    """Test empty and single-value inputs"""
+    assert calculate_average([]) == 0.0
+    assert calculate_standard_deviation([]) == 0.0
+    assert calculate_standard_deviation([5.0]) == 0.0
+    assert calculate_average(np.ones(NUMPY_MIN_VALUES)) == 1.0
@@ -0,0 +1,178 @@
+"""
+Tests for pattern recognition
+"""
+
+import asyncio
+import json
+import math
+import numpy as np
+import pytest
+from src.curve_intelligence.pattern_kernels import scan_patterns
+from src.curve_intelligence.pattern_recognition import (
+    OFFLOAD_MIN_TRANSACTIONS,
+    PatternRecognizer,
+    PatternType,
+)
+
+
+class FakeCollector:
+    """Data collector stub returning fixed transactions"""
+    
+    def __init__(self, transactions):
+        self.transactions = transactions
+    
+    async def get_recent_transactions(self, token_mint, time_window_minutes):
+        return self.transactions
+
+
+def make_transactions(count, interval=5.0, price_step=1.0, amount=1.0):
+    """Build evenly spaced transactions with geometric price moves"""
+    return [
+        {
+            "timestamp": 1000.0 + i * interval,
+            "price": price_step ** i,
+            "amount": amount,
+            "wallet": f"wallet{i}"
+        }
+        for i in range(count)
+    ]
+
+
+def pattern_types(patterns):
+    return [pattern["type"] for pattern in patterns]
+
+
+@pytest.mark.asyncio
+async def test_detect_patterns_no_transactions():
+    """Test no patterns without transactions"""
+    recognizer = PatternRecognizer()
+    
+    assert await recognizer.detect_patterns(None) == []
+
+
+@pytest.mark.asyncio
+async def test_detect_bot_activity():
+    """Test regular, frequent transactions are flagged as bot activity"""
+    recognizer = PatternRecognizer(FakeCollector(make_transactions(10)))
+    
+    patterns = await recognizer.detect_patterns(None)
+    
+    bot = [pattern for pattern in patterns if pattern["type"] == PatternType.BOT_ACTIVITY.value]
+    assert len(bot) == 1
+    assert bot[0]["avg_interval"] == pytest.approx(5.0)
+    assert bot[0]["variance"] == pytest.approx(0.0)
+    assert bot[0]["transaction_count"] == 10
+
+
+@pytest.mark.asyncio
+async def test_detect_bot_activity_unordered():
+    """Test interval statistics do not depend on delivery order"""
+    transactions = make_transactions(10)
+    transactions.reverse()
+    recognizer = PatternRecognizer(FakeCollector(transactions))
+    
+    patterns = await recognizer.detect_patterns(None)
+    
+    bot = [pattern for pattern in patterns if pattern["type"] == PatternType.BOT_ACTIVITY.value]
+    assert len(bot) == 1
+    assert bot[0]["avg_interval"] == pytest.approx(5.0)
+
+
+@pytest.mark.asyncio
+async def test_detect_pump_and_dump():
+    """Test rising prices are a pump and falling prices a dump"""
+    pump = await PatternRecognizer(
+        FakeCollector(make_transactions(6, interval=100.0, price_step=1.2))
+    ).detect_patterns(None)
+    dump = await PatternRecognizer(
+        FakeCollector(make_transactions(6, interval=100.0, price_step=0.8))
+    ).detect_patterns(None)
+    
+    assert pattern_types(pump) == [PatternType.PUMP_PATTERN.value]
+    assert pump[0]["avg_price_change"] == pytest.approx(0.2)
+    assert pattern_types(dump) == [PatternType.DUMP_PATTERN.value]
+    assert dump[0]["avg_price_change"] == pytest.approx(-0.2)
+
+
+@pytest.mark.asyncio
+async def test_detect_whales_and_anomalies():
+    """Test an outsized transaction is both a whale movement and an anomaly"""
+    transactions = make_transactions(20, interval=100.0)
+    transactions[7]["amount"] = 500.0
+    recognizer = PatternRecognizer(FakeCollector(transactions))
+    
+    patterns = await recognizer.detect_patterns(None)
+    
+    assert pattern_types(patterns) == [PatternType.WHALE_MOVEMENT.value, PatternType.ANOMALY.value]
+    whale, anomaly = patterns
+    assert whale["wallet"] == "wallet7"
+    assert whale["amount"] == 500.0
+    assert whale["confidence"] == 1.0
+    assert anomaly["timestamp"] == transactions[7]["timestamp"]
+    assert anomaly["deviation"] > 3
+    
+    # Types are PatternType members, which serialize as plain strings
+    assert anomaly["type"] is PatternType.ANOMALY
+    assert json.dumps(anomaly["type"]) == '"anomaly"'
+
+
+@pytest.mark.asyncio
+async def test_detect_patterns_large_window():
+    """Test windows scanned in a worker thread give the same patterns"""
+    transactions = make_transactions(OFFLOAD_MIN_TRANSACTIONS)
+    transactions[7]["amount"] = 1e6
+    
+    patterns = await PatternRecognizer(FakeCollector(transactions)).detect_patterns(None)
+    
+    assert pattern_types(patterns) == [
+        PatternType.WHALE_MOVEMENT.value,
+        PatternType.BOT_ACTIVITY.value,
+        PatternType.ANOMALY.value,
+    ]
+
+
+class CountingCollector:
+    """Data collector stub tracking concurrent transaction fetches"""
+    
+    def __init__(self, transactions_by_mint):
+        self.transactions_by_mint = transactions_by_mint
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+    
+    async def get_recent_transactions(self, token_mint, time_window_minutes):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return self.transactions_by_mint.get(token_mint, [])
+
+
+@pytest.mark.asyncio
+async def test_detect_patterns_batch():
+    """Test batch detection bounds concurrency and maps patterns per mint"""
+    collector = CountingCollector({"bot": make_transactions(10)})
+    recognizer = PatternRecognizer(collector)
+    mints = ["bot", "quiet1", "quiet2", "quiet3", "bot"]
+    
+    results = await recognizer.detect_patterns_batch(mints, max_concurrency=2)
+    
+    assert list(results) == ["bot", "quiet1", "quiet2", "quiet3"]
+    assert pattern_types(results["bot"]) == [PatternType.BOT_ACTIVITY]
+    assert results["quiet1"] == []
+    assert collector.calls == 4
+    assert collector.peak == 2
+
+
+def test_scan_patterns_empty():
+    """Test statistics without enough samples are NaN"""
+    empty = np.empty(0, dtype=np.float64)
+    
+    scan = scan_patterns(empty, empty, empty)
+    
+    assert scan.whale_indices.size == 0
+    assert scan.anomaly_indices.size == 0
+    assert math.isnan(scan.whale_threshold)
+    assert math.isnan(scan.avg_interval)
+    assert math.isnan(scan.avg_price_change)
@@ -0,0 +1,251 @@
+"""
+Tests for risk detector
+"""
+
+import json
+import time
+import pytest
+from solders.pubkey import Pubkey
+from src.curve_intelligence.risk_detector import RiskDetector, RiskLevel
+from src.data.transactions import TxBatch
+
+
+class FakeCollector:
+    """Data collector stub recording transaction fetches"""
+    
+    def __init__(self, transactions):
+        self.transactions = transactions
+        self.requested_windows = []
+    
+    async def get_recent_transactions(self, token_mint, time_window_minutes):
+        self.requested_windows.append(time_window_minutes)
+        return self.transactions
+
+
+def make_transactions(start, count, interval, amount=1.0):
+    """Build evenly spaced transactions, oldest first"""
+    return [
+        {"timestamp": start + i * interval, "amount": amount}
+        for i in range(count)
+    ]
+
+
+def test_calculate_sniper_risk():
+    """Test sniper probability thresholds"""
+    detector = RiskDetector()
+    
+    assert detector._calculate_sniper_risk(0.0) == RiskLevel.LOW
+    assert detector._calculate_sniper_risk(0.4) == RiskLevel.MEDIUM
+    assert detector._calculate_sniper_risk(0.6) == RiskLevel.HIGH
+    assert detector._calculate_sniper_risk(1.0) == RiskLevel.CRITICAL
+
+
+def test_analyze_sniper_patterns_unordered():
+    """Test the average interval does not depend on transaction order"""
+    detector = RiskDetector()
+    transactions = [{"timestamp": t} for t in (30.0, 0.0, 10.0, 60.0)]
+    
+    indicators = detector._analyze_sniper_patterns(transactions, 5)
+    
+    assert indicators["avg_time_between"] == pytest.approx(20.0)
+    assert indicators["transaction_count"] == 4
+    assert indicators["frequency"] == pytest.approx(4 / 300)
+
+
+def test_identify_clusters_matches_python():
+    """Test the compiled cluster scan matches the NumPy scan"""
+    detector = RiskDetector()
+    transactions = (
+        make_transactions(0, 3, 20.0, amount=2.0) +
+        make_transactions(500, 1, 1.0) +
+        make_transactions(100, 4, 15.0)
+    )
+    
+    clusters = detector._identify_clusters(transactions, 10)
+    
+    assert clusters == detector._identify_clusters_numpy(transactions)
+    assert [cluster["transaction_count"] for cluster in clusters] == [3, 4]
+    assert clusters[0]["total_volume"] == 6.0
+    assert clusters[1]["start_time"] == 100
+    assert clusters[1]["end_time"] == 145
+
+
+@pytest.mark.asyncio
+async def test_assess_risk_without_transactions():
+    """Test risk assessment with no transaction history"""
+    detector = RiskDetector()
+    token_mint = Pubkey.from_string("11111111111111111111111111111111")
+    
+    assessment = await detector.assess_risk(token_mint)
+    
+    assert assessment["token_mint"] == str(token_mint)
+    assert assessment["overall_risk"] == RiskLevel.LOW.value
+    assert assessment["sniper_activity"]["is_active"] is False
+    assert assessment["buy_clusters"] == []
+
+
+@pytest.mark.asyncio
+async def test_assess_risk_fetches_transactions_once():
+    """Test one fetch serves both the sniper and cluster windows"""
+    now = time.time()
+    older = make_transactions(now - 540, 3, 10.0)  # Cluster window only
+    recent = make_transactions(now - 60, 4, 5.0)  # Also in the sniper window
+    collector = FakeCollector(older + recent)
+    detector = RiskDetector(data_collector=collector)
+    token_mint = Pubkey.from_string("11111111111111111111111111111111")
+    
+    assessment = await detector.assess_risk(token_mint)
+    
+    assert collector.requested_windows == [10]
+    assert assessment["sniper_activity"]["indicators"]["transaction_count"] == 4
+    clusters = assessment["buy_clusters"]
+    assert [cluster["transaction_count"] for cluster in clusters] == [3, 4]
+    assert clusters[1]["total_volume"] == 4.0
+
+
+@pytest.mark.asyncio
+async def test_assess_risk_columnar_batch():
+    """Test a columnar batch gives the same assessment as transaction dicts"""
+    now = time.time()
+    transactions = make_transactions(now - 540, 3, 10.0) + make_transactions(now - 60, 4, 5.0)
+    token_mint = Pubkey.from_string("11111111111111111111111111111111")
+    
+    from_dicts = await RiskDetector(FakeCollector(transactions)).assess_risk(token_mint)
+    from_batch = await RiskDetector(
+        FakeCollector(TxBatch.from_records(transactions))
+    ).assess_risk(token_mint)
+    
+    batch_indicators = from_batch["sniper_activity"]["indicators"]
+    assert batch_indicators == from_dicts["sniper_activity"]["indicators"]
+    assert from_batch["buy_clusters"] == from_dicts["buy_clusters"]
+
+
+def test_calculate_overall_risk_thresholds():
+    """Test overall risk levels change at each threshold"""
+    detector = RiskDetector()
+    
+    def overall(probability, cluster_count, liquidity_score):
+        return detector._calculate_overall_risk(
+            {"probability": probability},
+            [{}] * cluster_count,
+            {"risk_score": liquidity_score}
+        )
+    
+    assert overall(0.0, 0, 0.0) == RiskLevel.LOW
+    assert overall(1.0, 0, 0.0) == RiskLevel.MEDIUM  # 0.4
+    assert overall(1.0, 1, 0.0) == RiskLevel.MEDIUM  # 0.46
+    assert overall(1.0, 5, 0.0) == RiskLevel.HIGH  # 0.7
+    assert overall(1.0, 5, 1.0) == RiskLevel.CRITICAL  # 1.0
+
+
+class BatchCollector(FakeCollector):
+    """Data collector stub serving batch fetches per mint"""
+    
+    def __init__(self, transactions_by_mint):
+        super().__init__([])
+        self.transactions_by_mint = transactions_by_mint
+        self.batch_calls = []
+    
+    async def get_recent_transactions_batch(
+        self,
+        token_mints,
+        time_window_minutes,
+        max_concurrency=32
+    ):
+        self.batch_calls.append(list(token_mints))
+        return {mint: self.transactions_by_mint.get(mint, []) for mint in token_mints}
+
+
+@pytest.mark.asyncio
+async def test_assess_risk_batch():
+    """Test batch assessment fetches once and matches single assessments"""
+    now = time.time()
+    busy = Pubkey.new_unique()
+    quiet = Pubkey.new_unique()
+    collector = BatchCollector({busy: make_transactions(now - 60, 4, 5.0)})
+    detector = RiskDetector(data_collector=collector)
+    
+    results = await detector.assess_risk_batch([busy, quiet, busy])
+    
+    assert collector.batch_calls == [[busy, quiet]]
+    assert collector.requested_windows == []
+    assert list(results) == [busy, quiet]
+    assert results[busy]["buy_clusters"][0]["transaction_count"] == 4
+    assert results[quiet]["buy_clusters"] == []
+
+
+@pytest.mark.asyncio
+async def test_assess_risk_shares_one_timestamp():
+    """Test the assessment and its sniper result carry the same timestamp"""
+    detector = RiskDetector()
+    
+    assessment = await detector.assess_risk(Pubkey.new_unique())
+    
+    assert assessment["timestamp"] == assessment["sniper_activity"]["timestamp"]
+    assert assessment["timestamp"].endswith("+00:00")
+
+
+def test_assess_liquidity_risk_buckets():
+    """Test liquidity ratios map to their risk buckets"""
+    detector = RiskDetector()
+    
+    def assess(liquidity):
+        return detector._assess_liquidity_risk({"liquidity": liquidity, "market_cap": 100.0})
+    
+    assert assess(5.0)["risk_level"] == RiskLevel.CRITICAL.value
+    assert assess(10.0)["risk_level"] == RiskLevel.HIGH.value
+    assert assess(40.0)["risk_score"] == 0.5
+    assert assess(50.0)["risk_level"] == RiskLevel.LOW.value
+    assert assess(50.0)["liquidity_ratio"] == 0.5
+    assert detector._assess_liquidity_risk({"liquidity": 1.0})["risk_score"] == 0.9
+
+
+def test_identify_clusters_presorted():
+    """Test presorted transactions give the same clusters without sorting"""
+    detector = RiskDetector()
+    transactions = make_transactions(0, 3, 20.0) + make_transactions(100, 4, 15.0)
+    
+    expected = detector._identify_clusters(list(reversed(transactions)), 10)
+    
+    assert detector._identify_clusters(transactions, 10, presorted=True) == expected
+    assert detector._identify_clusters_numpy(transactions, presorted=True) == expected
+
+
+@pytest.mark.asyncio
+async def test_assess_risk_carries_enum_levels():
+    """Test risk levels are RiskLevel members that serialize as strings"""
+    assessment = await RiskDetector().assess_risk(Pubkey.new_unique())
+    
+    assert assessment["overall_risk"] is RiskLevel.LOW
+    assert assessment["sniper_activity"]["risk_level"] is RiskLevel.LOW
+    assert assessment["liquidity_risk"]["risk_level"] is RiskLevel.MEDIUM
+    assert json.dumps(assessment["overall_risk"]) == '"low"'
+
+
+def test_scan_transactions_matches_separate_analyses():
+    """Test the fused scan gives the sniper and cluster results of separate passes"""
+    detector = RiskDetector()
+    transactions = make_transactions(0, 3, 20.0, amount=2.0) + make_transactions(300, 5, 4.0)
+    
+    indicators, clusters = detector._scan_transactions(transactions, 310.0, presorted=True)
+    
+    assert indicators == detector._analyze_sniper_patterns(transactions[-2:], 5)  # 312 and 316
+    assert clusters == detector._identify_clusters(transactions, 10)
+    assert detector._scan_transactions([], 0.0) == (detector._analyze_sniper_patterns([], 5), [])
+
+
+@pytest.mark.asyncio
+async def test_quiet_assessments_do_not_share_state():
+    """Test quiet-token assessments use liquidity data and fresh indicator dicts"""
+    detector = RiskDetector()
+    curve_data = {"liquidity": 5.0, "market_cap": 100.0}
+    
+    first = await detector.assess_risk(Pubkey.new_unique(), curve_data)
+    second = await detector.assess_risk(Pubkey.new_unique())
+    
+    assert first["liquidity_risk"]["risk_level"] is RiskLevel.CRITICAL
+    assert first["overall_risk"] is RiskLevel.LOW  # 0.9 * 0.3
+    assert first["sniper_activity"]["indicators"] == detector._analyze_sniper_patterns([], 5)
+    
+    first["sniper_activity"]["indicators"]["probability"] = 1.0
+    assert second["sniper_activity"]["indicators"]["probability"] == 0.0
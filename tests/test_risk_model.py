@@ -0,0 +1,49 @@
+"""
+Tests for risk model
+"""
+
+import numpy as np
+import pytest
+from src.curve_intelligence.risk_detector import RiskLevel
+from src.curve_intelligence.risk_model import (
+    classify_risk,
+    classify_risk_batch,
+    score_risk,
+    score_risk_batch,
+)
+
+
+def test_classify_risk():
+    """Test risk level thresholds, including exact boundaries"""
+    assert classify_risk(0.0) == RiskLevel.LOW
+    assert classify_risk(0.301) == RiskLevel.LOW
+    assert classify_risk(0.35) == RiskLevel.MEDIUM
+    assert classify_risk(0.7) == RiskLevel.HIGH
+    assert classify_risk(0.815) == RiskLevel.HIGH
+    assert classify_risk(0.9) == RiskLevel.CRITICAL
+    assert classify_risk(1.0) == RiskLevel.CRITICAL
+
+
+def test_classify_risk_batch_matches_scalar():
+    """Test batch classification agrees with scalar classification"""
+    scores = [0.0, 0.34, 0.35, 0.69, 0.7, 0.89, 0.9, 1.0]
+    
+    levels = classify_risk_batch(scores)
+    
+    assert levels.tolist() == [classify_risk(score).value for score in scores]
+
+
+def test_score_risk_batch_matches_scalar():
+    """Test batch scoring matches the scalar formula"""
+    features = np.array([
+        [0.75, 0.58, 0.864, 0.55],
+        [0.0, 0.0, 0.0, 0.0],
+        [1.0, 1.0, 1.0, 1.0],
+    ])
+    
+    scores = score_risk_batch(features)
+    
+    assert scores[1] == 0.0
+    assert scores[2] == pytest.approx(1.0)
+    for row, score in zip(features, scores):
+        assert score == pytest.approx(score_risk(*row))
@@ -0,0 +1,75 @@
+"""
+Tests for window optimizer
+"""
+
+import dataclasses
+from datetime import datetime, timezone
+import pytest
+from src.curve_intelligence.risk_detector import RiskLevel
+from src.curve_intelligence.window_optimizer import WindowOptimizer
+
+
+def calculate(risk_assessment, curve_analysis=None):
+    return WindowOptimizer()._calculate_window(
+        risk_assessment,
+        curve_analysis or {},
+        "buy",
+        1.0,
+        30
+    )
+
+
+def test_calculate_window_risk_levels():
+    """Test known risk strings map to their level and unknown ones to medium"""
+    assert calculate({"overall_risk": "critical"}).risk_level is RiskLevel.CRITICAL
+    assert calculate({"overall_risk": RiskLevel.LOW}).risk_level is RiskLevel.LOW
+    assert calculate({"overall_risk": "unknown"}).risk_level is RiskLevel.MEDIUM
+    assert calculate({}).risk_level is RiskLevel.MEDIUM
+
+
+def test_calculate_window_timing_and_confidence():
+    """Test window timing and confidence for a low-risk assessment"""
+    window = calculate(
+        {"overall_risk": "low", "sniper_activity": {"probability": 0.5}},
+        {"volatility": 0.5, "liquidity_depth": 0.5}
+    )
+    
+    assert (window.end_time - window.start_time).total_seconds() == 20 * 60
+    assert window.optimal_time == window.start_time + (window.end_time - window.start_time) / 2
+    assert window.expected_slippage == pytest.approx(0.05)
+    assert window.confidence == pytest.approx(0.9 * (1 - 0.5 * 0.3))
+    assert window.sniper_activity == 0.5
+
+
+def test_calculate_window_caps_wait():
+    """Test a critical window is short and the wait is capped by max_wait"""
+    window = WindowOptimizer()._calculate_window({"overall_risk": "critical"}, {}, "sell", 1.0, 3)
+    
+    assert (window.end_time - window.start_time).total_seconds() == 5 * 60
+    assert window.confidence == pytest.approx(0.3 * (1 - 0.5 * 0.3))
+
+
+def test_execution_window_is_immutable():
+    """Test execution windows are frozen, slotted and hashable"""
+    window = calculate({"overall_risk": "high"})
+    
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        window.confidence = 1.0
+    assert not hasattr(window, "__dict__")
+    assert hash(window) == hash(dataclasses.replace(window))
+
+
+def test_calculate_window_tables():
+    """Test each risk level gets its window length and wait"""
+    expected = {"critical": (5, 10), "high": (10, 15), "medium": (15, 20), "low": (20, 30)}
+    
+    for risk, (window_minutes, wait_minutes) in expected.items():
+        before = datetime.now(timezone.utc)
+        window = calculate({"overall_risk": risk})
+        wait = (window.start_time - before).total_seconds()
+        
+        assert (window.end_time - window.start_time).total_seconds() == window_minutes * 60
+        assert wait_minutes * 60 <= wait < wait_minutes * 60 + 5
+    
+    capped = WindowOptimizer()._calculate_window({"overall_risk": "low"}, {}, "buy", 1.0, 3)
+    assert (capped.start_time - datetime.now(timezone.utc)).total_seconds() <= 3 * 60